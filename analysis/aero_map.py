@@ -6,10 +6,13 @@ Provides:
 - Drag force vs speed
 - Downforce vs speed
 - Simple aerodynamic model using Cd, Cl, and frontal area
+- Gridded Cd/Cl maps over ride height, pitch, yaw (loaded from data/setups)
+  with O(1) batched multilinear interpolation
 
 """
 
 from dataclasses import dataclass
+import json
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -30,6 +33,110 @@ class AeroMap:
         return 0.5 * self.rho * self.cl * self.area * velocity**2
 
 
+@dataclass(frozen=True, eq=False)
+class AeroMapGrid:
+    """
+    Cd and Cl tabulated on a regular grid (any number of axes, e.g. ride
+    height, pitch and yaw). Queries are arrays of points: the cell of each
+    point is found arithmetically from the uniform spacing and the 2^d cell
+    corners are blended, so a lookup costs O(1) per point.
+
+    edge="clamp" holds the edge values outside the grid; edge="extrapolate"
+    extends the edge cells linearly. Instances compare and hash by identity.
+    """
+    names: tuple           # axis names, in table order
+    start: np.ndarray      # first grid value per axis
+    step: np.ndarray       # grid spacing per axis
+    cd: np.ndarray         # drag coefficient table, one dimension per axis
+    cl: np.ndarray         # lift coefficient table (positive = downforce)
+    area: float            # frontal area (m²)
+    rho: float = 1.225     # air density (kg/m³)
+    edge: str = "clamp"
+
+    def __post_init__(self):
+        if self.edge not in ("clamp", "extrapolate"):
+            raise ValueError(f"Unknown edge mode '{self.edge}', expected 'clamp' or 'extrapolate'")
+        if self.cd.shape != self.cl.shape or self.cd.ndim != len(self.names):
+            raise ValueError("cd and cl tables must have one dimension per axis")
+        if min(self.cd.shape) < 2:
+            raise ValueError("every axis needs at least two grid points")
+
+    @classmethod
+    def from_json(cls, filename, edge: str = "clamp") -> "AeroMapGrid":
+        """Load a map written as {"area", "rho", "axes": [{"name", "values"}...], "cd", "cl"}."""
+        with open(filename) as f:
+            data = json.load(f)
+        names, start, step = [], [], []
+        for axis in data["axes"]:
+            values = np.asarray(axis["values"], dtype=float)
+            spacing = np.diff(values)
+            if not np.allclose(spacing, spacing[0], rtol=1e-6, atol=1e-12) or spacing[0] <= 0:
+                raise ValueError(f"axis '{axis['name']}' must be increasing and uniformly spaced")
+            names.append(axis["name"])
+            start.append(values[0])
+            step.append(spacing.mean())
+        return cls(tuple(names), np.array(start), np.array(step),
+                   np.asarray(data["cd"], dtype=float), np.asarray(data["cl"], dtype=float),
+                   area=data["area"], rho=data.get("rho", 1.225), edge=edge)
+
+    def coefficients(self, *coords):
+        """
+        Interpolated (cd, cl) at the given per-axis coordinates (broadcast
+        together). Points with a non-finite coordinate (sensor dropouts) get NaN.
+        """
+        if len(coords) != len(self.names):
+            raise ValueError(f"expected coordinates for {self.names}")
+        coords = np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in coords))
+        shape = coords[0].shape
+        strides = np.cumprod((self.cd.shape + (1,))[:0:-1])[::-1]
+
+        # Cell of every point from the uniform spacing, and its position inside the cell
+        base = np.zeros(coords[0].size, dtype=np.intp)
+        missing = np.zeros(coords[0].size, dtype=bool)
+        fractions = []
+        for c, start, step, n, stride in zip(coords, self.start, self.step, self.cd.shape, strides):
+            u = (c.ravel() - start) / step
+            bad = ~np.isfinite(u)
+            if bad.any():
+                missing |= bad
+                u = np.where(bad, 0.0, u)
+            i = np.clip(np.floor(u), 0, n - 2).astype(np.intp)
+            f = u - i
+            if self.edge == "clamp":
+                f = np.clip(f, 0.0, 1.0)
+            base += i * stride
+            fractions.append(f)
+
+        cd_table, cl_table = self.cd.ravel(), self.cl.ravel()
+        cd = np.zeros(base.size)
+        cl = np.zeros(base.size)
+        for corner in range(1 << len(coords)):
+            weight = 1.0
+            offset = 0
+            for k, (f, stride) in enumerate(zip(fractions, strides)):
+                if corner >> k & 1:
+                    weight = weight * f
+                    offset += stride
+                else:
+                    weight = weight * (1.0 - f)
+            index = base + offset
+            cd += weight * cd_table.take(index)
+            cl += weight * cl_table.take(index)
+        cd[missing] = np.nan
+        cl[missing] = np.nan
+        return cd.reshape(shape), cl.reshape(shape)
+
+    def drag_force(self, velocity, *coords):
+        """Aerodynamic drag force (N) at the given speeds and map coordinates."""
+        cd, _ = self.coefficients(*coords)
+        return 0.5 * self.rho * cd * self.area * np.asarray(velocity)**2
+
+    def downforce(self, velocity, *coords):
+        """Aerodynamic downforce (N) at the given speeds and map coordinates."""
+        _, cl = self.coefficients(*coords)
+        return 0.5 * self.rho * cl * self.area * np.asarray(velocity)**2
+
+
 # Example usage and plotting
 
 if __name__ == "__main__":
@@ -44,6 +151,22 @@ if __name__ == "__main__":
     for v in [30, 50, 70]:
         print(f"Speed {v} m/s → Drag = {aero.drag_force(v):.1f} N, Downforce = {aero.downforce(v):.1f} N")
 
+    # Gridded map: one million (ride height, pitch, yaw) queries in one call
+    import os
+    import time
+    grid = AeroMapGrid.from_json(os.path.join(os.path.dirname(__file__), "..", "data", "setups",
+                                              "aero_map_demo.json"))
+    rng = np.random.default_rng(0)
+    ride_height = rng.uniform(0.015, 0.075, 1_000_000)
+    pitch = rng.normal(0.0, 0.5, ride_height.size)
+    yaw = np.abs(rng.normal(0.0, 3.0, ride_height.size))
+    start = time.perf_counter()
+    cd, cl = grid.coefficients(ride_height, pitch, yaw)
+    elapsed = time.perf_counter() - start
+    print(f"Aero grid {dict(zip(grid.names, grid.cd.shape))}: {ride_height.size} lookups in "
+          f"{elapsed * 1000:.0f} ms, Cl range {cl.min():.2f}–{cl.max():.2f}")
+    print(f"Downforce at 30 m/s, 35 mm, level: {float(grid.downforce(30.0, 0.035, 0.0, 0.0)):.1f} N")
+
     # Plot
     plt.plot(velocities, drag, label="Drag Force")
     plt.plot(velocities, df, label="Downforce")
@@ -6,7 +6,8 @@ Provides a simple model using:
 - Tire friction coefficient (mu)
 - Corner radius (m)
 - Vehicle mass (kg)
-- Aerodynamic downforce (optional)
+- Aerodynamic downforce (optional, quadratic or any callable model)
+- Vectorized corner-speed limits over arrays of radii
 
 """
 
@@ -21,22 +22,77 @@ class CorneringModel:
     mu: float
     downforce_coeff: float = 0.0  # N per (m/s)²
     g: float = 9.81
+    downforce_model: object = None  # optional callable: speed (m/s) -> downforce (N)
 
     def normal_force(self, speed: float) -> float:
         """Total normal load = weight + aerodynamic load."""
-        aero_load = self.downforce_coeff * speed**2
+        if self.downforce_model is not None:
+            aero_load = self.downforce_model(speed)
+        else:
+            aero_load = self.downforce_coeff * speed**2
         return self.mass * self.g + aero_load
 
     def cornering_speed(self, radius: float, speed_guess: float = 30.0) -> float:
         """
-        Solve v = sqrt( (mu * N) * r / m )
-        Iterative because N depends on v (aero load).
+        Grip-limited cornering speed for one radius (inf when not grip-limited).
+        `speed_guess` is kept for compatibility; see cornering_speeds.
         """
-        v = speed_guess
-        for _ in range(20):
-            N = self.normal_force(v)
-            v = np.sqrt((self.mu * N * radius) / self.mass)
-        return v
+        speeds, _ = self.cornering_speeds(radius)
+        return speeds if np.ndim(speeds) else float(speeds)
+
+    def cornering_speeds(self, radii, tol: float = 1e-9, max_iter: int = 200,
+                         max_speed: float = 1e3):
+        """
+        Grip-limited cornering speed for an array of radii.
+
+        The speed solves m v² / r = mu * N(v). With quadratic downforce
+        (k * v²) the solution has the closed form
+            v² = mu * m * g * r / (m - mu * k * r),
+        and the radius is not grip-limited when the denominator is <= 0.
+        Straights (infinite radius) are never grip-limited. For any other
+        `downforce_model` the same test is applied at `max_speed`: radii
+        still grip-limited there are solved by bisection on [0, max_speed]
+        (to a relative `tol`, at most `max_iter` halvings), all together.
+
+        Returns:
+            speeds (m/s, inf where unbounded) and a boolean mask of the radii
+            that are not grip-limited.
+        """
+        r = np.asarray(radii, dtype=float)
+        straight = np.isinf(r)
+
+        if self.downforce_model is None:
+            aero = self.mu * self.downforce_coeff * np.where(straight, 0.0, r)
+            denom = self.mass - aero
+            unbounded = straight | (denom <= 0)
+            v2 = self.mu * self.mass * self.g * np.where(unbounded, 0.0, r) / np.where(unbounded, 1.0, denom)
+            speeds = np.where(unbounded, np.inf, np.sqrt(v2))
+            return speeds, unbounded
+
+        def excess(v, radius):
+            # Lateral force needed minus grip available; its root is the corner speed
+            return self.mass * v**2 / radius - self.mu * self.normal_force(v)
+
+        flat_r = r.reshape(-1)
+        flat_speeds = np.full(flat_r.shape, np.inf)
+        limited = np.flatnonzero(~np.isinf(flat_r))
+        limited = limited[excess(np.full(limited.size, max_speed), flat_r[limited]) >= 0]
+        flat_unbounded = np.ones(flat_r.shape, dtype=bool)
+        flat_unbounded[limited] = False
+
+        lo = np.zeros(limited.size)
+        hi = np.full(limited.size, max_speed)
+        radius = flat_r[limited]
+        for _ in range(max_iter):
+            mid = 0.5 * (lo + hi)
+            above = excess(mid, radius) >= 0
+            hi = np.where(above, mid, hi)
+            lo = np.where(above, lo, mid)
+            if np.all(hi - lo <= tol * np.maximum(hi, 1.0)):
+                break
+        flat_speeds[limited] = 0.5 * (lo + hi)
+
+        return flat_speeds.reshape(r.shape), flat_unbounded.reshape(r.shape)
 
 
 # Example usage and plotting
@@ -45,20 +101,22 @@ if __name__ == "__main__":
     model = CorneringModel(
         mass=230.0,
         mu=1.8,
-        downforce_coeff=12.0  # N per (m/s)²
+        downforce_coeff=1.0  # N per (m/s)²
     )
 
     radii = np.linspace(10, 200, 80)
-    speeds = [model.cornering_speed(r) for r in radii]
+    speeds, unbounded = model.cornering_speeds(radii)
 
     # Print sample outputs
     print("Cornering Speed Example:")
-    for r in [20, 50, 100]:
-        v = model.cornering_speed(r)
+    sample_speeds, _ = model.cornering_speeds([20, 50, 100])
+    for r, v in zip([20, 50, 100], sample_speeds):
         print(f"Radius {r} m → Speed = {v*3.6:.1f} km/h")
+    if unbounded.any():
+        print(f"Not grip-limited above {radii[unbounded].min():.1f} m radius")
 
     # Plot
-    plt.plot(radii, np.array(speeds) * 3.6, label="Cornering Speed")
+    plt.plot(radii[~unbounded], speeds[~unbounded] * 3.6, label="Cornering Speed")
     plt.xlabel("Corner Radius (m)")
     plt.ylabel("Speed (km/h)")
     plt.title("Cornering Speed vs Radius")
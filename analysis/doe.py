@@ -0,0 +1,182 @@
+# doe.py
+
+"""
+Design-of-experiments (DOE) runner for lap and straight-line simulations.
+Provides:
+- Full-factorial parameter grids
+- Latin-hypercube designs
+- Case evaluators built from LapSimulator / SimpleSimulator templates
+- Process-pool sweep runner with chunked dispatch and per-worker throughput
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+import itertools
+import os
+import time
+import numpy as np
+
+
+# Designs
+
+def grid_design(**levels) -> np.ndarray:
+    """
+    Full-factorial design over the given parameter levels.
+
+    Example: grid_design(mass=[220, 240], power=[70e3, 80e3, 90e3]) -> 6 cases.
+    Every field keeps the dtype of its levels, so integer or string settings
+    (e.g. solver=["distance", "time"]) reach the evaluator unconverted.
+    """
+    names = list(levels)
+    values = [np.asarray(levels[n]) for n in names]
+    dtype = [(name, v.dtype) for name, v in zip(names, values)]
+    rows = list(itertools.product(*(v.tolist() for v in values)))
+    return np.array(rows, dtype=dtype)
+
+
+def latin_hypercube(bounds: dict, samples: int, seed=None) -> np.ndarray:
+    """
+    Latin-hypercube design: each parameter range is split into `samples`
+    equal strata and every stratum is sampled exactly once.
+
+    bounds: dict {name: (low, high)}
+    """
+    rng = np.random.default_rng(seed)
+    names = list(bounds)
+    strata = rng.permuted(np.tile(np.arange(samples), (len(names), 1)), axis=1)
+    unit = (strata + rng.random((len(names), samples))) / samples
+
+    design = np.empty(samples, dtype=[(name, float) for name in names])
+    for name, u in zip(names, unit):
+        low, high = bounds[name]
+        design[name] = low + u * (high - low)
+    return design
+
+
+# Case evaluators
+
+@dataclass
+class StraightLineCase:
+    """Run a SimpleSimulator template with each case's fields replaced."""
+    template: object
+
+    def __call__(self, params: dict) -> dict:
+        t, v, x = replace(self.template, **params).run()
+        return {"final_speed": v[-1], "distance": x[-1]}
+
+
+@dataclass
+class LapCase:
+    """
+    Run a LapSimulator template with each case's fields replaced.
+    Parameters that belong to the physics model (mass, power, ...) are
+    routed to `template.physics`, the rest to the simulator itself.
+    """
+    template: object
+
+    def __call__(self, params: dict) -> dict:
+        physics_fields = {f.name for f in fields(self.template.physics)}
+        physics_params = {k: v for k, v in params.items() if k in physics_fields}
+        sim_params = {k: v for k, v in params.items() if k not in physics_fields}
+
+        physics = replace(self.template.physics, **physics_params)
+        sim = replace(self.template, physics=physics, **sim_params)
+        positions, speeds, lap_time = sim.run()
+        return {"lap_time": lap_time, "max_speed": np.max(speeds)}
+
+
+def _run_chunk(evaluate, names, rows):
+    """Evaluate one chunk of cases inside a worker process."""
+    start = time.perf_counter()
+    results = [evaluate(dict(zip(names, row))) for row in rows]
+    return os.getpid(), time.perf_counter() - start, results
+
+
+# Sweep runner
+
+@dataclass
+class SweepRunner:
+    evaluate: object              # picklable callable: dict -> dict of scalar outputs
+    workers: int = None           # defaults to os.cpu_count()
+    chunk_size: int = None        # defaults to ~4 chunks per worker
+
+    def run(self, design: np.ndarray):
+        """
+        Evaluate every case of a structured design array.
+
+        Returns:
+            results: structured array with the design fields followed by the
+                     evaluator outputs, in input order.
+            report:  dict with wall time, overall and per-worker throughput.
+        """
+        workers = self.workers or os.cpu_count() or 1
+        chunk = self.chunk_size or max(1, -(-len(design) // (workers * 4)))
+        names = design.dtype.names
+        rows = design.tolist()
+        chunks = [rows[i:i + chunk] for i in range(0, len(rows), chunk)]
+
+        start = time.perf_counter()
+        if workers == 1:
+            outputs = [_run_chunk(self.evaluate, names, c) for c in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_run_chunk, self.evaluate, names, c) for c in chunks]
+                outputs = [f.result() for f in futures]
+        wall = time.perf_counter() - start
+
+        case_results = [r for _, _, chunk_results in outputs for r in chunk_results]
+        out_names = list(case_results[0]) if case_results else []
+        results = np.empty(len(design), dtype=design.dtype.descr + [(n, float) for n in out_names])
+        for name in names:
+            results[name] = design[name]
+        for name in out_names:
+            results[name] = [r[name] for r in case_results]
+
+        per_worker = {}
+        for pid, elapsed, chunk_results in outputs:
+            stats = per_worker.setdefault(pid, {"cases": 0, "seconds": 0.0})
+            stats["cases"] += len(chunk_results)
+            stats["seconds"] += elapsed
+        for stats in per_worker.values():
+            stats["cases_per_s"] = stats["cases"] / stats["seconds"] if stats["seconds"] else float("inf")
+
+        report = {
+            "cases": len(design),
+            "workers": workers,
+            "chunk_size": chunk,
+            "wall_time": wall,
+            "cases_per_s": len(design) / wall if wall else float("inf"),
+            "per_worker": per_worker,
+        }
+        return results, report
+
+
+# Example usage
+
+if __name__ == "__main__":
+    from analysis.lap_simulator import SimplePhysics, SimpleTrack, TrackSegment, LapSimulator
+
+    physics = SimplePhysics(mass=230.0, power=80_000.0, drag_coeff=0.9, frontal_area=1.2)
+    track = SimpleTrack([
+        TrackSegment(100, "straight"),
+        TrackSegment(40, "corner", radius=25),
+        TrackSegment(120, "straight"),
+        TrackSegment(30, "corner", radius=18),
+    ])
+
+    design = latin_hypercube(
+        {"mass": (210.0, 260.0), "power": (60_000.0, 90_000.0), "grip": (1.0, 1.6)},
+        samples=2000,
+        seed=1,
+    )
+    runner = SweepRunner(LapCase(LapSimulator(physics, track, solver="distance")))
+    results, report = runner.run(design)
+
+    best = results[np.argmin(results["lap_time"])]
+    print("DOE Sweep Example:")
+    print(f"{report['cases']} cases on {report['workers']} workers → {report['cases_per_s']:.0f} cases/s")
+    for pid, stats in report["per_worker"].items():
+        print(f"  worker {pid}: {stats['cases']} cases, {stats['cases_per_s']:.0f} cases/s")
+    print(f"Best lap {best['lap_time']:.2f} s at mass={best['mass']:.0f} kg, "
+          f"power={best['power'] / 1000:.0f} kW, grip={best['grip']:.2f}")
@@ -12,10 +12,10 @@ Integration demo for analysis modules:
 import numpy as np
 import matplotlib.pyplot as plt
 
-from lap_simulator import SimplePhysics, SimpleTrack, TrackSegment, LapSimulator
-from cornering_model import CorneringModel
-from aero_map import AeroMap
-from telemetry_tools import TelemetryTools
+from analysis.lap_simulator import SimplePhysics, SimpleTrack, TrackSegment, LapSimulator
+from analysis.cornering_model import CorneringModel
+from analysis.aero_map import AeroMap
+from analysis.telemetry_tools import TelemetryTools
 
 
 # ---------------------------------------------------------
@@ -36,7 +36,7 @@ track = SimpleTrack([
     TrackSegment(30, "corner", radius=18),
 ])
 
-lap_sim = LapSimulator(physics, track)
+lap_sim = LapSimulator(physics, track, solver="distance")
 pos, speeds, lap_time = lap_sim.run()
 
 
@@ -51,7 +51,7 @@ corner_model = CorneringModel(
 )
 
 radii = np.linspace(10, 200, 80)
-corner_speeds = [corner_model.cornering_speed(r) for r in radii]
+corner_speeds, unbounded = corner_model.cornering_speeds(radii)
 
 
 # ---------------------------------------------------------
@@ -83,7 +83,7 @@ accel = tools.differentiate(smooth_signal, dt=t[1] - t[0])
 print("=== Analysis Integration Example ===")
 print(f"Lap time → {lap_time:.2f} s")
 print(f"Max lap speed → {np.max(speeds) * 3.6:.1f} km/h")
-print(f"Cornering speed at 50 m radius → {corner_model.cornering_speed(50) * 3.6:.1f} km/h")
+print(f"Cornering speed at 8 m radius → {corner_model.cornering_speeds(8)[0] * 3.6:.1f} km/h")
 print(f"Drag at 60 m/s → {aero.drag_force(60):.1f} N")
 print(f"Smoothed signal mean → {tools.stats(smooth_signal)['mean']:.2f}")
 
@@ -97,13 +97,13 @@ plt.figure(figsize=(12, 8))
 # Lap speed profile
 plt.subplot(2, 2, 1)
 plt.plot(pos, speeds * 3.6)
-plt.xlabel("Track Position (units)")
+plt.xlabel("Track Position (m)")
 plt.ylabel("Speed (km/h)")
 plt.title("Lap Speed Profile")
 
 # Cornering speed vs radius
 plt.subplot(2, 2, 2)
-plt.plot(radii, np.array(corner_speeds) * 3.6)
+plt.plot(radii[~unbounded], corner_speeds[~unbounded] * 3.6)
 plt.xlabel("Corner Radius (m)")
 plt.ylabel("Speed (km/h)")
 plt.title("Cornering Speed vs Radius")
@@ -6,6 +6,7 @@ Provides:
 - Power‑limited acceleration model
 - Cornering speed model
 - Track composed of straights and corners
+- Distance-domain quasi-steady-state lap solver (forward/backward passes)
 - Example usage with a speed profile plot
 
 """
@@ -14,6 +15,73 @@ from dataclasses import dataclass
 import numpy as np
 import matplotlib.pyplot as plt
 
+from simulation import forces
+from utils.backend import kernel
+
+
+# Time-stepped lap kernels (see utils.backend)
+
+def _time_stepped_numpy(lengths, is_corner, corner_limits, dt, mass, power, drag_coeff, frontal_area, rho):
+    """
+    Corners are filled in one vectorized call. On straights the Euler
+    recurrence (forces.acceleration spelled out in the loop kernel's
+    operation order, on Python floats) is stepped only until it
+    settles on a fixed point (or a two-value rounding cycle) at terminal
+    speed; the remaining steps are then filled in one call, which gives
+    bit-identical results to the loop.
+    """
+    half_rho_area = 0.5 * (rho * frontal_area)
+    chunks = []
+    v = 0.0
+    for i in range(lengths.size):
+        steps = int(lengths[i] / (max(v, 1e-3) * dt)) + 1
+        if is_corner[i]:
+            v = min(v, corner_limits[i])
+            chunks.append(np.full(steps, v))
+            continue
+        seg = np.empty(steps)
+        previous = np.nan
+        for j in range(steps):
+            v_next = max(v + (power / max(v, 1e-3) - drag_coeff * (half_rho_area * (v * v))) / mass * dt, 0.0)
+            if v_next == v:
+                seg[j:] = v
+                break
+            if v_next == previous:
+                seg[j::2] = v_next
+                seg[j + 1::2] = v
+                v = seg[-1]
+                break
+            previous, v = v, v_next
+            seg[j] = v
+        chunks.append(seg)
+    return np.concatenate(chunks) if chunks else np.zeros(0)
+
+
+@kernel(_time_stepped_numpy)
+def _time_stepped(lengths, is_corner, corner_limits, dt, mass, power, drag_coeff, frontal_area, rho):
+    """
+    Per-step loop: Euler acceleration on straights, speed capped in corners.
+    The acceleration is forces.acceleration written out in its operation order.
+    """
+    half_rho_area = 0.5 * (rho * frontal_area)
+    speeds = np.empty(1024)
+    n = 0
+    v = 0.0
+    for i in range(lengths.size):
+        steps = int(lengths[i] / (max(v, 1e-3) * dt)) + 1
+        if n + steps > speeds.size:
+            grown = np.empty(max(2 * speeds.size, n + steps))
+            grown[:n] = speeds[:n]
+            speeds = grown
+        for _ in range(steps):
+            if is_corner[i]:
+                v = min(v, corner_limits[i])
+            else:
+                v = max(v + (power / max(v, 1e-3) - drag_coeff * (half_rho_area * (v * v))) / mass * dt, 0.0)
+            speeds[n] = v
+            n += 1
+    return speeds[:n]
+
 
 # Simple Physics Model
 
@@ -27,13 +95,12 @@ class SimplePhysics:
 
     def drag_force(self, speed: float) -> float:
         """Aerodynamic drag force (N)."""
-        return 0.5 * self.rho * self.drag_coeff * self.frontal_area * speed**2
+        return forces.drag_force(speed, self.drag_coeff, self.frontal_area, self.rho)
 
     def acceleration(self, speed: float) -> float:
         """Power‑limited acceleration (m/s²)."""
-        wheel_force = self.power / max(speed, 1e-3)
-        net_force = wheel_force - self.drag_force(speed)
-        return net_force / self.mass
+        return forces.acceleration(speed, self.mass, self.power, self.drag_coeff,
+                                   self.frontal_area, self.rho)
 
 
 # Simple Track Model
@@ -61,34 +128,124 @@ class LapSimulator:
     track: SimpleTrack
     grip: float = 1.2
     dt: float = 0.1
+    solver: str = "time"        # "time" (legacy, sample-indexed positions) or "distance" (quasi-steady-state)
+    ds: float = 0.5             # station spacing for the distance solver (m)
+    speed_samples: int = 2000   # resolution of the speed-domain lookup curves
 
-    def corner_speed(self, radius: float) -> float:
+    def corner_speed(self, radius):
         """Cornering speed using v = sqrt(mu * g * r)."""
         g = 9.81
         return np.sqrt(self.grip * g * radius)
 
+    def braking_deceleration(self, speed):
+        """Grip-limited braking deceleration plus drag assistance (m/s²)."""
+        g = 9.81
+        return self.grip * g + self.physics.drag_force(speed) / self.physics.mass
+
     def run(self):
         """Simulate a lap and return position, speed, and lap time."""
-        speeds = []
-        positions = []
-        total_time = 0.0
-        v = 0.0
+        if self.solver == "distance":
+            return self.run_distance()
+        if self.solver == "time":
+            return self.run_time()
+        raise ValueError(f"Unknown solver '{self.solver}', expected 'distance' or 'time'")
+
+    def stations(self):
+        """
+        Discretize the track into stations spaced at most `ds` apart.
+
+        Returns:
+            positions (m) and the speed limit (m/s) at every station.
+        """
+        lengths = np.array([seg.length for seg in self.track.segments], dtype=float)
+        radii = np.array([seg.radius if seg.segment_type == "corner" else np.inf
+                          for seg in self.track.segments], dtype=float)
+        counts = np.maximum(np.ceil(lengths / self.ds).astype(int), 1)
+
+        steps = np.repeat(lengths / counts, counts)
+        positions = np.concatenate(([0.0], np.cumsum(steps)))
+
+        # A station on a segment boundary must respect both neighbouring intervals
+        interval_limit = self.corner_speed(np.repeat(radii, counts))
+        padded = np.concatenate(([np.inf], interval_limit, [np.inf]))
+        limits = np.minimum(padded[:-1], padded[1:])
+        return positions, limits
+
+    def _speed_curves(self, x, v_limit):
+        """
+        Distance needed to reach each speed from rest when accelerating, and
+        to shed it to rest when braking: s(v) = integral of v / a(v) dv.
+
+        The curves end just below terminal speed. Without drag there is none;
+        they then end at the speed reachable from rest over the whole lap
+        (a = P / (m v) gives s = m v³ / 3P), or the fastest corner limit.
+        """
+        power = self.physics.power
+        k = self.physics.drag_force(1.0)                          # drag per (m/s)²
+        if power <= 0:
+            raise ValueError(f"The distance solver needs positive power, got {power}")
+        if k < 0:
+            raise ValueError(f"The distance solver needs non-negative drag, got {k} N/(m/s)²")
+        if k > 0:
+            v_top = 0.999 * (power / k) ** (1.0 / 3.0)            # just below terminal speed
+        else:
+            finite = v_limit[np.isfinite(v_limit)]
+            v_top = max((3.0 * power * x[-1] / self.physics.mass) ** (1.0 / 3.0),
+                        finite.max() if finite.size else 0.0)
+        v = np.linspace(0.0, v_top, self.speed_samples)
+
+        def cumulative(integrand):
+            areas = 0.5 * (integrand[1:] + integrand[:-1]) * np.diff(v)
+            return np.concatenate(([0.0], np.cumsum(areas)))
+
+        s_accel = cumulative(v / self.physics.acceleration(v))
+        s_brake = cumulative(v / self.braking_deceleration(v))
+        return v, s_accel, s_brake
+
+    def run_distance(self):
+        """
+        Quasi-steady-state lap solver in the distance domain.
+
+        The forward (acceleration-limited) and backward (braking-limited)
+        passes are expressed through the monotonic curves s(v), so each pass
+        reduces to a running minimum over all stations and an interpolation.
+        The car starts from rest at position 0.
+        """
+        x, v_limit = self.stations()
+        v_limit[0] = 0.0
+        v, s_accel, s_brake = self._speed_curves(x, v_limit)
+
+        launch = np.minimum.accumulate(np.interp(v_limit, v, s_accel) - x)
+        v_forward = np.interp(launch + x, s_accel, v)
 
-        for seg in self.track.segments:
-            length = seg.length
-            steps = int(length / (max(v, 1e-3) * self.dt)) + 1
+        stop = np.minimum.accumulate((np.interp(v_limit, v, s_brake) + x)[::-1])[::-1]
+        v_backward = np.interp(stop - x, s_brake, v)
 
-            for _ in range(steps):
-                if seg.segment_type == "straight":
-                    v = max(v + self.physics.acceleration(v) * self.dt, 0)
-                else:
-                    v = min(v, self.corner_speed(seg.radius))
+        speeds = np.minimum(v_forward, v_backward)
+        mean_speed = 0.5 * (speeds[1:] + speeds[:-1])
+        lap_time = float(np.sum(np.diff(x) / mean_speed))
+        return x, speeds, lap_time
 
-                speeds.append(v)
-                positions.append(len(positions))
-                total_time += self.dt
+    def run_time(self):
+        """Legacy time-stepped simulation (no braking, Euler integration)."""
+        segments = self.track.segments
+        is_corner = np.array([seg.segment_type != "straight" for seg in segments], dtype=bool)
+        radii = np.array([seg.radius if corner else 0.0
+                          for seg, corner in zip(segments, is_corner)], dtype=float)
+        physics = self.physics
 
-        return np.array(positions), np.array(speeds), total_time
+        speeds = _time_stepped(
+            np.array([seg.length for seg in segments], dtype=float),
+            is_corner,
+            self.corner_speed(radii),
+            self.dt,
+            float(physics.mass),
+            float(physics.power),
+            float(physics.drag_coeff),
+            float(physics.frontal_area),
+            float(physics.rho),
+        )
+        return np.arange(speeds.size), speeds, speeds.size * self.dt
 
 
 # Example Usage and Plotting
@@ -108,7 +265,7 @@ if __name__ == "__main__":
         TrackSegment(30, "corner", radius=18),
     ])
 
-    sim = LapSimulator(physics, track)
+    sim = LapSimulator(physics, track, solver="distance")
     pos, speeds, lap_time = sim.run()
 
     print("Lap Simulation Example:")
@@ -116,7 +273,7 @@ if __name__ == "__main__":
     print(f"Max speed: {np.max(speeds) * 3.6:.1f} km/h")
 
     plt.plot(pos, speeds * 3.6, label="Speed (km/h)")
-    plt.xlabel("Track Position (units)")
+    plt.xlabel("Track Position (m)")
     plt.ylabel("Speed (km/h)")
     plt.title("Lap Speed Profile")
     plt.grid(True)
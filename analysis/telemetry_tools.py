@@ -3,9 +3,11 @@
 """
 Module for basic telemetry processing and visualization.
 Provides:
-- Signal smoothing
+- O(n) signal smoothing (cumulative-sum moving average, exponential filter)
+- Stateful streaming filters that match the whole-array results exactly
+- Multi-channel (channels, samples) batch processing with optional out= buffers
 - Numerical differentiation
-- Basic statistics
+- Basic statistics, plus mergeable single-pass streaming statistics
 - Example usage with plotting
 
 """
@@ -15,34 +17,291 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 
+class MovingAverageFilter:
+    """
+    Centered moving average computed from running prefix sums, O(n) for any
+    window. Near the ends the window shrinks to the available samples.
+    Chunks may be 1-D or (channels, samples); filtering runs along the last axis.
+
+    `process(chunk)` returns every output whose window is complete, so output
+    lags input by window // 2 samples; `flush()` returns the rest. Because the
+    prefix sums continue sequentially across chunks, the concatenated outputs
+    are bit-for-bit identical to a single whole-array call.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.before = window // 2          # samples before the centre
+        self.after = (window - 1) // 2     # samples after the centre
+        self.shift = None                  # first sample per channel, subtracted for precision
+        self.total = 0                     # samples seen
+        self.emitted = 0                   # outputs returned
+        self.base = 0                      # absolute index of prefix[..., 0]
+        self.prefix = None                 # running sums of (x - shift)
+
+    def process(self, chunk, out=None) -> np.ndarray:
+        chunk = np.asarray(chunk, dtype=float)
+        if chunk.shape[-1]:
+            if self.shift is None:
+                self.shift = chunk[..., :1].copy()
+                self.prefix = np.zeros(chunk.shape[:-1] + (1,))
+            tail = np.cumsum(np.concatenate((self.prefix[..., -1:], chunk - self.shift), axis=-1),
+                             axis=-1)[..., 1:]
+            self.prefix = np.concatenate((self.prefix, tail), axis=-1)
+            self.total += chunk.shape[-1]
+        return self._emit(max(self.total - self.after, self.emitted), out)
+
+    def flush(self, out=None) -> np.ndarray:
+        return self._emit(self.total, out)
+
+    def _emit(self, last, out) -> np.ndarray:
+        first = self.emitted
+        if self.prefix is None:
+            return np.empty(0) if out is None else out
+        if out is None:
+            out = np.empty(self.prefix.shape[:-1] + (last - first,))
+        prefix = self.prefix
+        base = self.base
+
+        # Full windows are contiguous prefix slices; only the edges need gathers
+        lo = min(max(first, self.before), last)
+        hi = max(min(last, self.total - self.after), lo)
+        np.subtract(prefix[..., lo + self.after + 1 - base:hi + self.after + 1 - base],
+                    prefix[..., lo - self.before - base:hi - self.before - base],
+                    out=out[..., lo - first:hi - first])
+        out[..., lo - first:hi - first] /= self.window
+        for edge in (np.arange(first, lo), np.arange(hi, last)):
+            start = np.maximum(edge - self.before, 0)
+            stop = np.minimum(edge + self.after + 1, self.total)
+            out[..., edge - first] = (prefix[..., stop - base] - prefix[..., start - base]) / (stop - start)
+        out += self.shift
+
+        self.emitted = last
+        keep = max(last - self.before, 0)
+        self.prefix = prefix[..., keep - base:]
+        self.base = keep
+        return out
+
+
+class ExponentialFilter:
+    """
+    First-order exponential filter y[n] = y[n-1] + alpha * (x[n] - y[n-1]),
+    starting from y[-1] = x[0]. Chunks may be 1-D or (channels, samples).
+
+    The recurrence is evaluated in closed form over blocks anchored at fixed
+    absolute sample positions,
+        y[b+j] = d^(j+1) * (y[b-1] + alpha * sum_{i<=j} x[b+i] * d^-(i+1)),  d = 1 - alpha,
+    with the block length chosen so d^-j cannot overflow. The per-block state
+    is carried between `process` calls, so streamed outputs are bit-for-bit
+    identical to a single whole-array call.
+    """
+
+    def __init__(self, alpha: float):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self.alpha = alpha
+        self.decay = 1.0 - alpha
+        if self.decay > 0:
+            self.block = int(min(max(1, 150 * np.log(10) / -np.log(self.decay)), 1 << 16))
+        else:
+            self.block = 1
+        self.position = 0       # samples seen
+        self.y_block = None     # output just before the current block, per channel
+        self.acc = None         # running weighted sum within the current block, per channel
+
+    def process(self, chunk, out=None) -> np.ndarray:
+        x = np.asarray(chunk, dtype=float)
+        if out is None:
+            out = np.empty_like(x)
+        total = x.shape[-1]
+        if self.decay == 0:
+            self.position += total
+            out[...] = x
+            return out
+        if total and self.y_block is None:
+            self.y_block = x[..., 0].copy()
+            self.acc = np.zeros(x.shape[:-1])
+
+        done = 0
+        while done < total:
+            j0 = self.position % self.block
+            n = min(self.block - j0, total - done)
+            j = np.arange(j0 + 1, j0 + n + 1, dtype=float)
+
+            weighted = x[..., done:done + n] * self.decay ** -j
+            acc = np.cumsum(np.concatenate((self.acc[..., None], weighted), axis=-1), axis=-1)[..., 1:]
+            np.multiply(self.decay ** j, self.y_block[..., None] + self.alpha * acc,
+                        out=out[..., done:done + n])
+
+            self.acc = acc[..., -1]
+            self.position += n
+            done += n
+            if self.position % self.block == 0:
+                self.y_block = out[..., done - 1].copy()
+                self.acc = np.zeros_like(self.acc)
+        return out
+
+
+class RunningStats:
+    """
+    Streaming count / min / max / mean / variance accumulator.
+
+    Each chunk is reduced block by block while it is cache-resident, and the
+    partial moments are combined with Chan et al.'s parallel update, so an
+    accumulator can absorb chunks one at a time or `merge` with accumulators
+    built elsewhere (other chunks, other processes).
+
+    Approximate quantiles come from a bottom-k sketch: every sample gets a
+    uniform random key and the `sketch_size` samples with the smallest keys
+    are kept. That is a uniform sample of everything seen, and merging two
+    sketches (keep the smallest keys of the union) is exact.
+    """
+
+    BLOCK = 65536
+
+    def __init__(self, sketch_size: int = 2048, seed=None):
+        self.sketch_size = sketch_size
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+        self._keys = np.empty(0)
+        self._values = np.empty(0)
+
+    def update(self, chunk) -> "RunningStats":
+        """Absorb a chunk of samples (any shape; flattened)."""
+        x = np.asarray(chunk, dtype=float).ravel()
+        for start in range(0, x.size, self.BLOCK):
+            block = x[start:start + self.BLOCK]
+            mean = block.mean()
+            self._combine(block.size, mean, np.dot(block - mean, block - mean),
+                          block.min(), block.max())
+        if x.size and self._keys.size < self.sketch_size:
+            self._sketch(self._rng.random(x.size), x)
+        elif x.size:
+            # Only keys below the current cut-off can enter the sketch: draw how
+            # many there are, where they fall, and their (uniform) key values
+            tau = self._keys.max()
+            m = self._rng.binomial(x.size, tau)
+            idx = self._rng.choice(x.size, m, replace=False)
+            self._sketch(self._rng.uniform(0.0, tau, m), x[idx])
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Fold another accumulator into this one."""
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.min, other.max)
+            self._sketch(other._keys, other._values)
+        return self
+
+    def _combine(self, n, mean, m2, lo, hi):
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta**2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, lo)
+        self.max = max(self.max, hi)
+
+    def _sketch(self, keys, values):
+        if self._keys.size >= self.sketch_size:
+            cut = keys < self._keys.max()
+            keys, values = keys[cut], values[cut]
+        keys = np.concatenate((self._keys, keys))
+        values = np.concatenate((self._values, values))
+        if keys.size > self.sketch_size:
+            keep = np.argpartition(keys, self.sketch_size - 1)[:self.sketch_size]
+            keys, values = keys[keep], values[keep]
+        self._keys, self._values = keys, values
+
+    @property
+    def variance(self) -> float:
+        """Population variance (matches np.var)."""
+        return self.m2 / self.count if self.count else float("nan")
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.variance))
+
+    def quantile(self, q):
+        """Approximate quantile(s) from the sketch."""
+        return np.quantile(self._values, q)
+
+    def to_dict(self) -> dict:
+        """Same keys as TelemetryTools.stats, plus the sample count."""
+        return {
+            "min": float(self.min),
+            "max": float(self.max),
+            "mean": float(self.mean),
+            "std": self.std,
+            "count": self.count,
+        }
+
+
 @dataclass
 class TelemetryTools:
     smoothing_window: int = 5
 
-    def smooth(self, signal: np.ndarray) -> np.ndarray:
-        """Apply simple moving average smoothing."""
+    # All operations accept a 1-D signal or a (channels, samples) array and
+    # work along the last axis; `out=` writes into a preallocated buffer.
+
+    def smooth(self, signal: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Apply centered moving average smoothing in O(n), shrinking the window at the edges."""
         window = self.smoothing_window
+        signal = np.asarray(signal, dtype=float)
         if window < 2:
-            return signal
-        kernel = np.ones(window) / window
-        return np.convolve(signal, kernel, mode="same")
-
-    def differentiate(self, signal: np.ndarray, dt: float) -> np.ndarray:
-        """Numerical derivative using central differences."""
-        deriv = np.zeros_like(signal)
-        deriv[1:-1] = (signal[2:] - signal[:-2]) / (2 * dt)
-        deriv[0] = deriv[1]
-        deriv[-1] = deriv[-2]
+            if out is None:
+                return signal
+            out[...] = signal
+            return out
+        if out is None:
+            out = np.empty(signal.shape)
+        f = MovingAverageFilter(window)
+        head = max(signal.shape[-1] - f.after, 0)
+        f.process(signal, out=out[..., :head])
+        f.flush(out=out[..., head:])
+        return out
+
+    def exponential(self, signal: np.ndarray, alpha: float, out: np.ndarray = None) -> np.ndarray:
+        """Apply a first-order exponential filter in O(n)."""
+        return ExponentialFilter(alpha).process(signal, out=out)
+
+    def differentiate(self, signal: np.ndarray, dt: float, out: np.ndarray = None) -> np.ndarray:
+        """
+        Numerical derivative using central differences. Two-sample signals
+        get the one-sided difference and single samples a zero derivative.
+        """
+        signal = np.asarray(signal)
+        deriv = np.empty(signal.shape) if out is None else out
+        n = signal.shape[-1]
+        if n < 3:
+            if n == 2:
+                np.subtract(signal[..., 1:], signal[..., :1], out=deriv[..., :1])
+                deriv[..., :1] /= dt
+                deriv[..., 1:] = deriv[..., :1]
+            else:
+                deriv[...] = 0.0
+            return deriv
+        np.subtract(signal[..., 2:], signal[..., :-2], out=deriv[..., 1:-1])
+        deriv[..., 1:-1] /= 2 * dt
+        deriv[..., 0] = deriv[..., 1]
+        deriv[..., -1] = deriv[..., -2]
         return deriv
 
     def stats(self, signal: np.ndarray) -> dict:
-        """Return basic statistics for a signal."""
-        return {
-            "min": float(np.min(signal)),
-            "max": float(np.max(signal)),
-            "mean": float(np.mean(signal)),
-            "std": float(np.std(signal)),
+        """Return basic statistics for a signal (per channel for 2-D input)."""
+        signal = np.asarray(signal)
+        values = {
+            "min": np.min(signal, axis=-1),
+            "max": np.max(signal, axis=-1),
+            "mean": np.mean(signal, axis=-1),
+            "std": np.std(signal, axis=-1),
         }
+        if signal.ndim == 1:
+            return {name: float(v) for name, v in values.items()}
+        return values
 
 
 # Example usage and plotting
@@ -58,9 +317,21 @@ if __name__ == "__main__":
     print("Telemetry Statistics:")
     print(tools.stats(smooth_speed))
 
+    # Streaming: chunked filtering reproduces the whole-array result
+    stream = MovingAverageFilter(15)
+    chunks = [stream.process(raw_speed[i:i + 64]) for i in range(0, len(raw_speed), 64)]
+    streamed = np.concatenate(chunks + [stream.flush()])
+    print(f"Streamed smoothing matches: {np.array_equal(streamed, smooth_speed)}")
+
+    # Per-chunk statistics merged into session-wide statistics
+    partials = [RunningStats(seed=i).update(raw_speed[i::4]) for i in range(4)]
+    session = partials[0].merge(partials[1]).merge(partials[2]).merge(partials[3])
+    print(f"Merged stats: {session.to_dict()}, median ≈ {session.quantile(0.5):.2f}")
+
     plt.figure(figsize=(10, 5))
     plt.plot(t, raw_speed, alpha=0.4, label="Raw Speed")
     plt.plot(t, smooth_speed, label="Smoothed Speed")
+    plt.plot(t, tools.exponential(raw_speed, alpha=0.1), label="Exponential Filter")
     plt.plot(t, accel, label="Acceleration")
     plt.xlabel("Time (s)")
     plt.ylabel("Speed / Acceleration")
@@ -0,0 +1,118 @@
+# __main__.py
+
+"""
+Command-line entry point for the benchmark suite (run from the repo root).
+
+    python -m benchmarks list
+    python -m benchmarks run -o before.json
+    python -m benchmarks run -k smooth -k to_csv --max-size 100000 -o quick.json
+    python -m benchmarks compare before.json after.json --threshold 0.1
+
+`compare` exits with status 1 when any case regressed beyond the threshold.
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import cases  # noqa: F401  (registers the cases)
+from benchmarks.harness import (STATS, compare, format_seconds, load, machine_metadata,
+                                run, save, select)
+from utils.backend import available_backends, get_backend, set_backend
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _list(args):
+    for case in select(args.filter):
+        sizes = ", ".join(f"{n:,}" for n in case.sizes)
+        print(f"{case.name:36s} {case.unit:9s} {sizes}")
+    return 0
+
+
+def _run(args):
+    if args.backend:
+        set_backend(args.backend)
+    chosen = select(args.filter)
+    if not chosen:
+        print(f"No benchmark matches {args.filter}", file=sys.stderr)
+        return 2
+
+    def progress(result):
+        print(f"{result['name']:36s} {result['size']:>12,} {result['unit']:9s}"
+              f"{format_seconds(result['median'])}  ±{format_seconds(result['stdev'])}"
+              f"  ({result['number']}×{result['repeat']})", flush=True)
+
+    output = args.output or time.strftime("benchmark-%Y%m%d-%H%M%S.json")
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="fsae-bench-") as workdir:
+        results = run(chosen, workdir, sizes=args.sizes, max_size=args.max_size,
+                      repeat=args.repeat, budget=args.budget, progress=progress)
+
+    meta = machine_metadata(ROOT, backend=get_backend(), available_backends=list(available_backends()),
+                            settings={"filter": args.filter, "sizes": args.sizes,
+                                      "max_size": args.max_size, "repeat": args.repeat,
+                                      "budget": args.budget},
+                            wall_time=time.perf_counter() - start)
+    save(output, results, meta)
+    print(f"{len(results)} results saved to {output} ({meta['wall_time']:.1f} s)")
+    return 0
+
+
+def _compare(args):
+    report = compare(load(args.base), load(args.new), threshold=args.threshold, stat=args.stat)
+    if report["metadata_differs"]:
+        print(f"Warning: results differ in {', '.join(report['metadata_differs'])}; "
+              "timings may not be comparable", file=sys.stderr)
+
+    marks = {"regression": "  REGRESSION", "improvement": "  faster", "ok": ""}
+    for row in report["rows"]:
+        print(f"{row['name']:36s} {row['size']:>12,} {format_seconds(row['base'])} → "
+              f"{format_seconds(row['new'])}  {row['ratio']:6.2f}x{marks[row['status']]}")
+    for label, keys in (("only in base", report["only_base"]), ("only in new", report["only_new"])):
+        for name, size in keys:
+            print(f"{name:36s} {size:>12,}  ({label})")
+
+    regressions = report["regressions"]
+    print(f"{len(regressions)} regression(s) beyond {report['threshold']:.0%} "
+          f"({report['stat']} time) in {len(report['rows'])} comparable results")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark the simulator's hot paths.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    listing = commands.add_parser("list", help="list the benchmark cases and their sizes")
+    listing.add_argument("-k", "--filter", action="append", help="case name substring or glob (repeatable)")
+    listing.set_defaults(handler=_list)
+
+    timing = commands.add_parser("run", help="run the benchmarks and save the results as JSON")
+    timing.add_argument("-o", "--output", help="result file (default: benchmark-<timestamp>.json)")
+    timing.add_argument("-k", "--filter", action="append", help="case name substring or glob (repeatable)")
+    timing.add_argument("--sizes", type=int, nargs="+", help="override every case's size ladder")
+    timing.add_argument("--max-size", type=int, help="skip sizes above this")
+    timing.add_argument("--repeat", type=int, default=5, help="timing samples per size (default: 5)")
+    timing.add_argument("--budget", type=float, default=2.0,
+                        help="approximate seconds spent timing each size (default: 2)")
+    timing.add_argument("--backend", choices=("auto", "numba", "numpy"), help="kernel backend")
+    timing.set_defaults(handler=_run)
+
+    diff = commands.add_parser("compare", help="compare two result files and flag regressions")
+    diff.add_argument("base")
+    diff.add_argument("new")
+    diff.add_argument("--threshold", type=float, default=0.10,
+                      help="relative slowdown flagged as a regression (default: 0.10)")
+    diff.add_argument("--stat", choices=STATS, default="min", help="statistic compared (default: min)")
+    diff.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
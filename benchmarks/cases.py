@@ -0,0 +1,181 @@
+# cases.py
+
+"""
+Benchmark cases for the simulation, analysis and export hot paths.
+Includes:
+- LapSimulator.run (distance and time solvers) and Track.generate_xy,
+  from a 10-segment to a 10,000-segment track
+- SimpleSimulator.run, CorneringModel.cornering_speed(s),
+  TelemetryTools.smooth/differentiate and TelemetryExport.to_csv/to_json,
+  from 10³ to 10⁷ samples
+- SimpleSimulator.run on the NumPy fallback next to the original per-step
+  loop it replaced (up to 10⁶ samples)
+
+Inputs are generated from fixed seeds so every run times the same work.
+The text exports build one Python row per sample; their default ladder stops
+at 10⁶ because a 10⁷-row JSON document needs several GB of memory (pass
+--sizes to go further).
+
+"""
+
+import os
+
+import numpy as np
+
+from benchmarks.harness import benchmark
+
+SEGMENTS = (10, 100, 1_000, 10_000)
+SAMPLES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+EXPORT_SAMPLES = SAMPLES[:-1]
+LOOP_SAMPLES = SAMPLES[:-1]
+
+
+def _segments(n: int, seed: int = 0):
+    """Alternating straights and corners: lengths (m), corner flags, radii (m), directions."""
+    rng = np.random.default_rng(seed)
+    is_corner = np.arange(n) % 2 == 1
+    radii = np.where(is_corner, rng.uniform(8.0, 60.0, n), np.inf)
+    lengths = np.where(is_corner, radii * rng.uniform(0.3, 2.5, n), rng.uniform(20.0, 200.0, n))
+    directions = rng.choice((-1, 1), n)
+    return lengths, is_corner, radii, directions
+
+
+def _signal(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) * 0.01
+    return 20 + 5 * np.sin(2 * np.pi * 0.5 * t) + rng.normal(0, 0.8, n)
+
+
+def _lap_simulator(n, solver):
+    from analysis.lap_simulator import LapSimulator, SimplePhysics, SimpleTrack, TrackSegment
+
+    lengths, is_corner, radii, _ = _segments(n)
+    track = SimpleTrack([TrackSegment(length, "corner", radius) if corner
+                         else TrackSegment(length, "straight")
+                         for length, corner, radius in zip(lengths, is_corner, radii)])
+    physics = SimplePhysics(mass=230.0, power=80_000.0, drag_coeff=0.9, frontal_area=1.2)
+    return LapSimulator(physics, track, solver=solver).run
+
+
+@benchmark("lap_simulator.run[distance]", SEGMENTS, unit="segments")
+def lap_simulator_distance(n, workdir):
+    return _lap_simulator(n, "distance")
+
+
+@benchmark("lap_simulator.run[time]", SEGMENTS, unit="segments")
+def lap_simulator_time(n, workdir):
+    return _lap_simulator(n, "time")
+
+
+@benchmark("track.generate_xy", SEGMENTS, unit="segments")
+def track_generate_xy(n, workdir):
+    from simulation.track import Track, TrackSegment
+
+    lengths, is_corner, radii, directions = _segments(n)
+    track = Track([TrackSegment(length, "corner", radius, int(direction)) if corner
+                   else TrackSegment(length, "straight")
+                   for length, corner, radius, direction in zip(lengths, is_corner, radii, directions)])
+    return track.generate_xy
+
+
+@benchmark("simple_simulator.run", SAMPLES)
+def simple_simulator_run(n, workdir):
+    from simulation.simulator import SimpleSimulator
+
+    dt = 0.001
+    return SimpleSimulator(duration=(n - 1) * dt, dt=dt).run
+
+
+@benchmark("simple_simulator.run[numpy]", LOOP_SAMPLES)
+def simple_simulator_run_numpy(n, workdir):
+    from simulation.simulator import SimpleSimulator
+    from utils.backend import use_backend
+
+    dt = 0.001
+    sim = SimpleSimulator(duration=(n - 1) * dt, dt=dt)
+
+    def run():
+        with use_backend("numpy"):
+            return sim.run()
+    return run
+
+
+@benchmark("simple_simulator.run[baseline]", LOOP_SAMPLES)
+def simple_simulator_run_baseline(n, workdir):
+    """The original per-step SimpleSimulator.run loop, as the reference for the NumPy fallback."""
+    from simulation.simulator import SimpleSimulator
+
+    dt = 0.001
+    sim = SimpleSimulator(duration=(n - 1) * dt, dt=dt)
+
+    def run():
+        steps = int(sim.duration / sim.dt) + 1
+        t = np.linspace(0, sim.duration, steps)
+        v = np.zeros(steps)
+        x = np.zeros(steps)
+        for i in range(1, steps):
+            drag = 0.5 * sim.rho * sim.drag_coeff * sim.frontal_area * v[i - 1]**2
+            a = (sim.power / max(v[i - 1], 1e-3) - drag) / sim.mass
+            v[i] = max(v[i - 1] + a * sim.dt, 0.0)
+            x[i] = x[i - 1] + v[i] * sim.dt
+        return t, v, x
+    return run
+
+
+def _cornering_model():
+    from analysis.cornering_model import CorneringModel
+
+    return CorneringModel(mass=230.0, mu=1.8, downforce_coeff=1.5)
+
+
+@benchmark("cornering_model.cornering_speed", SAMPLES)
+def cornering_speed(n, workdir):
+    model = _cornering_model()
+    radii = np.random.default_rng(0).uniform(5.0, 200.0, n)
+    return lambda: model.cornering_speed(radii)
+
+
+@benchmark("cornering_model.cornering_speeds", SAMPLES)
+def cornering_speeds(n, workdir):
+    model = _cornering_model()
+    radii = np.random.default_rng(0).uniform(5.0, 200.0, n)
+    return lambda: model.cornering_speeds(radii)
+
+
+@benchmark("telemetry_tools.smooth", SAMPLES)
+def telemetry_smooth(n, workdir):
+    from analysis.telemetry_tools import TelemetryTools
+
+    tools, signal = TelemetryTools(smoothing_window=5), _signal(n)
+    out = np.empty_like(signal)
+    return lambda: tools.smooth(signal, out=out)
+
+
+@benchmark("telemetry_tools.differentiate", SAMPLES)
+def telemetry_differentiate(n, workdir):
+    from analysis.telemetry_tools import TelemetryTools
+
+    tools, signal = TelemetryTools(), _signal(n)
+    out = np.empty_like(signal)
+    return lambda: tools.differentiate(signal, 0.01, out=out)
+
+
+def _export(n, workdir, method, extension):
+    from telemetry.export import TelemetryExport
+
+    rng = np.random.default_rng(0)
+    columns = (np.arange(1, n + 1), rng.normal(75, 2, n), rng.uniform(40, 120, n),
+               np.linspace(0, 20, n), np.linspace(0, 1, n))
+    filename = os.path.join(workdir, f"export.{extension}")
+    write = getattr(TelemetryExport, method)
+    return lambda: write(filename, *columns)
+
+
+@benchmark("telemetry_export.to_csv", EXPORT_SAMPLES)
+def export_csv(n, workdir):
+    return _export(n, workdir, "to_csv", "csv")
+
+
+@benchmark("telemetry_export.to_json", EXPORT_SAMPLES)
+def export_json(n, workdir):
+    return _export(n, workdir, "to_json", "json")
@@ -0,0 +1,250 @@
+# harness.py
+
+"""
+Standard-library benchmark harness for the simulator's hot paths.
+Provides:
+- Registry of benchmark cases, each timed over a ladder of problem sizes
+- Adaptive timing on top of timeit (auto-ranged loop count, time budget)
+- Machine metadata (platform, CPU, Python, package versions, git revision)
+- JSON result files and a comparison that flags regressions
+
+A case is a function `setup(size, workdir)` that builds its inputs and
+returns the zero-argument callable to time; only that callable is measured.
+
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import fnmatch
+import gc
+from importlib import metadata as importlib_metadata
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+SCHEMA_VERSION = 1
+STATS = ("min", "median", "mean")
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: object          # setup(size, workdir) -> callable to time
+    sizes: tuple           # problem sizes, smallest first
+    unit: str              # what `size` counts ("segments", "samples")
+
+
+CASES = {}
+
+
+def benchmark(name: str, sizes, unit: str = "samples"):
+    """Register `setup(size, workdir)` as the benchmark case `name`."""
+    def register(setup):
+        if name in CASES:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+        CASES[name] = Case(name, setup, tuple(sorted(sizes)), unit)
+        return setup
+    return register
+
+
+def select(patterns=None):
+    """Registered cases whose name matches any of the glob `patterns` (all when empty)."""
+    if not patterns:
+        return list(CASES.values())
+    return [case for name, case in CASES.items()
+            if any(fnmatch.fnmatchcase(name, p) or p in name for p in patterns)]
+
+
+def time_call(fn, repeat: int = 5, budget: float = 2.0, warmup: bool = True) -> dict:
+    """
+    Time `fn()` and return per-call seconds.
+
+    The loop count is auto-ranged (timeit.Timer.autorange) so each sample
+    lasts at least 0.2 s, and the number of samples is cut down so the whole
+    measurement stays within `budget` seconds. A call that on its own
+    exceeds the budget is measured once and that single run is reported,
+    unless `warmup` requires it to be discarded (e.g. first-call JIT).
+    """
+    timer = timeit.Timer(fn)
+    start = time.perf_counter()
+    gc.collect()
+    fn()
+    first = time.perf_counter() - start
+
+    if first >= budget and not warmup:
+        samples, number = [first], 1
+    else:
+        if first >= budget:
+            number, per_sample = 1, first
+        else:
+            number, per_sample = timer.autorange()
+        rounds = max(1, min(repeat, int(budget // max(per_sample, 1e-9))))
+        samples = [total / number for total in timer.repeat(repeat=rounds, number=number)]
+
+    return {
+        "number": number,
+        "repeat": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def run(cases, workdir: str, sizes=None, max_size: int = None, repeat: int = 5,
+        budget: float = 2.0, progress=None) -> list:
+    """
+    Time every case at each of its sizes (or the given `sizes`), smallest first.
+
+    Only the first size of each case is warmed up before timing; larger
+    sizes reuse the compiled kernels and caches of the smaller ones.
+
+    Returns:
+        list of result dicts: name, unit, size, timing statistics and
+        seconds per item (median / size).
+    """
+    results = []
+    for case in cases:
+        ladder = sorted(sizes) if sizes else case.sizes
+        ladder = [n for n in ladder if max_size is None or n <= max_size]
+        for i, size in enumerate(ladder):
+            fn = case.setup(size, workdir)
+            timing = time_call(fn, repeat=repeat, budget=budget, warmup=i == 0)
+            del fn
+            result = {"name": case.name, "unit": case.unit, "size": size, **timing,
+                      "per_item": timing["median"] / size}
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+# Machine metadata
+
+def _version(package: str):
+    try:
+        return importlib_metadata.version(package)
+    except importlib_metadata.PackageNotFoundError:
+        return None
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _git_revision(root: str):
+    try:
+        rev = subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True,
+                             text=True, timeout=10)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                               capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if rev.returncode != 0:
+        return None
+    return rev.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "")
+
+
+def machine_metadata(root: str = None, **extra) -> dict:
+    """Describe the machine, interpreter and code revision the results came from."""
+    info = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "hostname": platform.node(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "executable": sys.executable,
+        "packages": {name: _version(name) for name in ("numpy", "numba", "matplotlib")},
+        "env": {name: os.environ[name] for name in
+                ("FSAE_BACKEND", "OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+                if name in os.environ},
+        "git": _git_revision(root or os.getcwd()),
+    }
+    info.update(extra)
+    return info
+
+
+# Result files
+
+def save(filename: str, results: list, meta: dict):
+    with open(filename, "w") as f:
+        json.dump({"schema": SCHEMA_VERSION, "metadata": meta, "results": results}, f, indent=2)
+
+
+def load(filename: str) -> dict:
+    with open(filename) as f:
+        data = json.load(f)
+    if data.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"{filename}: unsupported benchmark schema {data.get('schema')!r}")
+    return data
+
+
+# Comparison
+
+_COMPARABLE = ("machine", "cpu", "cpu_count", "python", "implementation", "packages", "backend")
+
+
+def compare(base: dict, new: dict, threshold: float = 0.10, stat: str = "min") -> dict:
+    """
+    Compare two loaded result files case by case.
+
+    A result is a regression when new / base > 1 + threshold and an
+    improvement when new / base < 1 / (1 + threshold).
+
+    Returns:
+        dict with rows (name, size, base, new, ratio, status), the names of
+        cases only present on one side, and the metadata fields that differ
+        (timings from different machines or versions are not comparable).
+    """
+    if stat not in STATS:
+        raise ValueError(f"Unknown statistic '{stat}', expected one of {STATS}")
+    old = {(r["name"], r["size"]): r for r in base["results"]}
+    cur = {(r["name"], r["size"]): r for r in new["results"]}
+
+    rows = []
+    for key in sorted(old.keys() & cur.keys()):
+        before, after = old[key][stat], cur[key][stat]
+        ratio = after / before if before > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({"name": key[0], "size": key[1], "base": before, "new": after,
+                     "ratio": ratio, "status": status})
+
+    meta_old, meta_new = base["metadata"], new["metadata"]
+    return {
+        "stat": stat,
+        "threshold": threshold,
+        "rows": rows,
+        "regressions": [r for r in rows if r["status"] == "regression"],
+        "only_base": sorted(old.keys() - cur.keys()),
+        "only_new": sorted(cur.keys() - old.keys()),
+        "metadata_differs": [name for name in _COMPARABLE
+                             if meta_old.get(name) != meta_new.get(name)],
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:7.2f} {unit}"
+    return f"{seconds / 1e-9:7.1f} ns"
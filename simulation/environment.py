@@ -8,39 +8,135 @@ This version supports:
 - Track grip level
 - Wind speed and direction
 - Air density calculation from temperature
+- Scalars, arrays or time/distance profiles for every condition
+- Vectorized evaluation along a compiled track (wind relative to heading)
 
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import numpy as np
 import matplotlib.pyplot as plt
 
 
+@dataclass(frozen=True)
+class Profile:
+    """
+    Piecewise-linear condition profile against session time (s) or track
+    distance (m), held constant beyond the first and last breakpoints.
+    """
+    points: tuple              # increasing breakpoints (s or m)
+    values: tuple              # condition value at each breakpoint
+    axis: str = "time"         # "time" or "distance"
+
+    def __post_init__(self):
+        if self.axis not in ("time", "distance"):
+            raise ValueError(f"Unknown profile axis '{self.axis}', expected 'time' or 'distance'")
+
+    def __call__(self, at):
+        return np.interp(at, self.points, self.values)
+
+
+def _frozen(values: np.ndarray) -> np.ndarray:
+    values.flags.writeable = False
+    return values
+
+
 @dataclass
 class Environment:
     temperature: float = 25.0      # °C
     wind_speed: float = 0.0        # m/s
     wind_direction: float = 0.0    # degrees (0 = headwind)
     grip: float = 1.0              # 1.0 = normal grip
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Any condition may be a float, an array or a Profile. Arrays are copied
+    # into read-only storage, so a condition can only change by reassignment,
+    # which drops the cache of derived values. Cached results are read-only.
+
+    def __setattr__(self, name, value):
+        if not name.startswith("_"):
+            if not (np.isscalar(value) or isinstance(value, Profile)):
+                value = _frozen(np.array(value, dtype=float))
+            if "_cache" in self.__dict__:
+                self._cache.clear()
+        super().__setattr__(name, value)
+
+    def condition(self, name: str, time=None, distance=None):
+        """Value of one condition, evaluating profiles at `time` or `distance`."""
+        value = getattr(self, name)
+        if isinstance(value, Profile):
+            at = time if value.axis == "time" else distance
+            if at is None:
+                raise ValueError(f"'{name}' varies with {value.axis}; pass {value.axis}=...")
+            return value(at)
+        return value if np.isscalar(value) else np.asarray(value, dtype=float)
 
-    def air_density(self) -> float:
+    def air_density(self, time=None, distance=None) -> float | np.ndarray:
         """
         Calculate air density (kg/m³) using a simplified formula.
+        Cached unless the temperature is a profile being evaluated.
         """
-        temp_k = self.temperature + 273.15
-        return 1.225 * (273.15 / temp_k)
+        profiled = isinstance(self.temperature, Profile)
+        if profiled or "air_density" not in self._cache:
+            temp_k = self.condition("temperature", time, distance) + 273.15
+            density = 1.225 * (273.15 / temp_k)
+            if profiled:
+                return density
+            self._cache["air_density"] = density if np.isscalar(density) else _frozen(density)
+        return self._cache["air_density"]
 
-    def wind_effect(self, vehicle_speed: float) -> float:
+    def wind_effect(self, vehicle_speed, heading=None, time=None, distance=None) -> float | np.ndarray:
         """
         Compute effective speed considering headwind/tailwind.
         Positive wind_direction = headwind.
+
+        Without `heading`, wind_direction is relative to the car. With a
+        heading (radians, as in CompiledTrack), wind_direction is the absolute
+        direction the wind blows from in the track frame (degrees, same
+        convention as the heading), so the headwind follows the track.
+        """
+        relative = np.radians(self.condition("wind_direction", time, distance))
+        if heading is not None:
+            relative = relative - np.asarray(heading)
+        return vehicle_speed + self.condition("wind_speed", time, distance) * np.cos(relative)
+
+    def along(self, track, time=None) -> dict:
         """
-        return vehicle_speed + self.wind_speed * np.cos(np.radians(self.wind_direction))
+        Evaluate every condition at each station of a CompiledTrack in one call.
+
+        `time` is the session time at each station (or one scalar for the
+        whole lap) and is only needed for time profiles. Results without a
+        time argument are cached per track.
+
+        Returns:
+            dict of per-station arrays: distance, temperature, air_density,
+            headwind (wind component against the direction of travel, m/s), grip.
+        """
+        cached = self._cache.get("along")
+        if time is None and cached is not None and cached[0] is track:
+            return dict(cached[1])
+
+        distance = track.distance
+        stations = np.ones(len(track))
+        result = {
+            "distance": distance.view(),
+            "temperature": stations * self.condition("temperature", time, distance),
+            "air_density": stations * self.air_density(time, distance),
+            "headwind": stations * self.wind_effect(0.0, track.heading, time, distance),
+            "grip": stations * self.condition("grip", time, distance),
+        }
+        for values in result.values():
+            values.flags.writeable = False
+        if time is None:
+            self._cache["along"] = (track, result)
+        return dict(result)
 
 
 # Example usage and plotting
 
 if __name__ == "__main__":
+    from simulation.track import Track, TrackSegment
+
     env = Environment(temperature=25, wind_speed=3, wind_direction=0)
 
     print("Environment Example:")
@@ -48,9 +144,24 @@ if __name__ == "__main__":
     print(f"Air density: {env.air_density():.3f} kg/m³")
     print(f"Effective speed at 20 m/s: {env.wind_effect(20):.2f} m/s")
 
-    # Plot air density vs temperature
+    # Air density vs temperature in one vectorized call
     temps = np.linspace(-10, 40, 100)
-    densities = [Environment(t).air_density() for t in temps]
+    densities = Environment(temps).air_density()
+
+    # Session profile: temperature drifting up over an hour, wind fixed in the track frame
+    session = Environment(temperature=Profile((0.0, 3600.0), (18.0, 27.0)),
+                          wind_speed=4.0, wind_direction=90.0)
+    compiled = Track([
+        TrackSegment(100, "straight"),
+        TrackSegment(np.pi * 25, "corner", radius=25, direction=1),
+        TrackSegment(100, "straight"),
+        TrackSegment(np.pi * 25, "corner", radius=25, direction=1),
+    ]).compile(ds=0.5)
+    lap_time = 3000.0 + compiled.distance / 15.0      # a lap driven at 15 m/s, 50 min in
+    conditions = session.along(compiled, time=lap_time)
+    print(f"Lap at 50 min: {conditions['temperature'].min():.2f}–{conditions['temperature'].max():.2f} °C, "
+          f"headwind {conditions['headwind'].min():+.1f} to {conditions['headwind'].max():+.1f} m/s "
+          f"over {len(compiled)} stations")
 
     plt.figure(figsize=(8, 4))
     plt.plot(temps, densities, label="Air Density")
@@ -36,7 +36,7 @@ accelerations = [physics.acceleration(v) for v in vel_ms]
 
 # Environment
 temps = np.linspace(-10, 40, 60)
-air_densities = [Environment(t).air_density() for t in temps]
+air_densities = Environment(temps).air_density()
 
 # Track
 track = Track([
@@ -0,0 +1,141 @@
+# forces.py
+
+"""
+Shared longitudinal force kernel for every vehicle model in the simulator.
+
+Includes:
+- Aerodynamic drag and downforce
+- Rolling resistance on the static plus aerodynamic normal load
+- Power-limited wheel force with an optional traction (grip) limit
+- Net acceleration combining all of the above
+- Example benchmark of scalar calls vs one array call
+
+Every function accepts scalars or arrays for every parameter (broadcast
+together, NumPy style) and takes an optional `out=` array that receives the
+result without allocating a new one.
+
+"""
+
+import math
+
+import numpy as np
+
+G = 9.81              # gravitational acceleration (m/s²)
+RHO = 1.225           # sea-level air density (kg/m³)
+SPEED_FLOOR = 1e-3    # speed floor for the power-limited wheel force (m/s)
+
+
+def _result(value, out):
+    """Return `out` when given, else the array (a NumPy scalar for 0-d results)."""
+    if out is not None:
+        return out
+    return value[()] if np.ndim(value) == 0 else value
+
+
+def drag_force(speed, drag_coeff, frontal_area, rho=RHO, out=None):
+    """Aerodynamic drag force (N): 0.5 * rho * Cd * A * v²."""
+    coeff = 0.5 * np.multiply(rho, np.multiply(drag_coeff, frontal_area))
+    return _result(np.multiply(np.square(speed, out=out), coeff, out=out), out)
+
+
+def downforce(speed, lift_coeff, frontal_area, rho=RHO, out=None):
+    """Aerodynamic downforce (N): 0.5 * rho * Cl * A * v², Cl positive = downforce."""
+    return drag_force(speed, lift_coeff, frontal_area, rho, out=out)
+
+
+def normal_load(mass, aero_load=0.0, g=G, out=None):
+    """Total tyre normal load (N): weight plus aerodynamic load."""
+    return _result(np.add(np.multiply(mass, g), aero_load, out=out), out)
+
+
+def rolling_resistance(mass, c_rr, aero_load=0.0, g=G, out=None):
+    """Rolling resistance (N) on the static plus aerodynamic normal load."""
+    return _result(np.multiply(normal_load(mass, aero_load, g, out=out), c_rr, out=out), out)
+
+
+def traction_limit(mass, mu, aero_load=0.0, g=G, out=None):
+    """Largest longitudinal tyre force (N): mu * (m g + aero load)."""
+    return _result(np.multiply(normal_load(mass, aero_load, g, out=out), mu, out=out), out)
+
+
+def wheel_force(speed, power, out=None):
+    """Power-limited wheel force (N): P / v, with v floored at SPEED_FLOOR."""
+    return _result(np.divide(power, np.maximum(speed, SPEED_FLOOR, out=out), out=out), out)
+
+
+def acceleration(speed, mass, power, drag_coeff, frontal_area, rho=RHO, c_rr=0.0,
+                 lift_coeff=0.0, mu=np.inf, g=G, out=None):
+    """
+    Net longitudinal acceleration (m/s²):
+
+        a = (min(P / v, mu * N) - D - c_rr * N) / m,   N = m g + L
+
+    where D and L are aerodynamic drag and downforce. With the defaults
+    (no rolling resistance, no downforce, unlimited grip) this reduces to
+    (P / v - 0.5 rho Cd A v²) / m.
+
+    Calls with only Python numbers (e.g. one step of a scalar recurrence)
+    are evaluated without NumPy, in the same operation order, so both paths
+    round identically.
+    """
+    if out is None and all(isinstance(p, (float, int)) for p in
+                           (speed, mass, power, drag_coeff, frontal_area, rho, c_rr, lift_coeff, mu, g)):
+        q = 0.5 * (rho * frontal_area) * (speed * speed)
+        load = mass * g + lift_coeff * q
+        force = power / max(speed, SPEED_FLOOR)
+        if mu != math.inf:
+            force = min(force, mu * load)
+        return (force - drag_coeff * q - c_rr * load) / mass
+
+    speed = np.asarray(speed, dtype=float)
+    q = 0.5 * np.multiply(rho, frontal_area) * np.square(speed)    # dynamic pressure x area
+    load = normal_load(mass, np.multiply(lift_coeff, q), g)
+    limited = not (np.isscalar(mu) and np.isinf(mu))
+
+    if out is None:
+        force = wheel_force(speed, power)
+        if limited:
+            force = np.minimum(force, np.multiply(mu, load))
+        return _result((force - np.multiply(drag_coeff, q) - np.multiply(c_rr, load)) / mass, None)
+
+    wheel_force(speed, power, out=out)
+    if limited:
+        np.minimum(out, np.multiply(mu, load), out=out)
+    out -= np.multiply(drag_coeff, q)
+    out -= np.multiply(c_rr, load)
+    out /= mass
+    return out
+
+
+# Example usage and benchmark
+
+if __name__ == "__main__":
+    import time
+
+    speeds = np.linspace(0.0, 45.0, 1_000_000)
+    params = dict(mass=230.0, power=80_000.0, drag_coeff=0.9, frontal_area=1.2,
+                  c_rr=0.015, lift_coeff=3.0, mu=1.4)
+
+    print("Force Kernel Example:")
+    for v in [20, 60, 100]:
+        print(f"Acceleration at {v} km/h → {acceleration(v / 3.6, **params):.2f} m/s² "
+              f"(traction limit {traction_limit(230.0, 1.4, downforce(v / 3.6, 3.0, 1.2)):.0f} N)")
+
+    subset = speeds[::100]
+    start = time.perf_counter()
+    scalar = np.array([acceleration(v, **params) for v in subset])
+    per_sample_loop = (time.perf_counter() - start) / subset.size
+
+    start = time.perf_counter()
+    batched = acceleration(speeds, **params)
+    per_sample_array = (time.perf_counter() - start) / speeds.size
+
+    buffer = np.empty_like(speeds)
+    start = time.perf_counter()
+    acceleration(speeds, **params, out=buffer)
+    per_sample_out = (time.perf_counter() - start) / speeds.size
+
+    print(f"Scalar calls: {per_sample_loop * 1e9:8.0f} ns/sample")
+    print(f"Array call:   {per_sample_array * 1e9:8.1f} ns/sample ({per_sample_loop / per_sample_array:.0f}x)")
+    print(f"Array + out=: {per_sample_out * 1e9:8.1f} ns/sample ({per_sample_loop / per_sample_out:.0f}x)")
+    print(f"Results match: {np.allclose(scalar, batched[::100]) and np.array_equal(batched, buffer)}")
@@ -5,8 +5,8 @@ Physics helper module for the FSAE Telemetry Simulator.
 
 Includes:
 - Aerodynamic drag force
-- Rolling resistance
-- Power‑limited acceleration
+- Rolling resistance (including aerodynamic load)
+- Power‑limited acceleration with an optional traction limit
 - Example usage with plotting
 
 """
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 import numpy as np
 import matplotlib.pyplot as plt
 
+from simulation import forces
+
 
 @dataclass
 class PhysicsModel:
@@ -24,25 +26,34 @@ class PhysicsModel:
     mass: float = 230.0           # kg
     c_rr: float = 0.015           # rolling resistance coefficient
     power: float = 80_000.0       # W
+    lift_coeff: float = 0.0       # Cl (positive = downforce)
+    mu: float = np.inf            # tyre friction coefficient (inf = no traction limit)
 
     def drag_force(self, speed: float) -> float:
         """Aerodynamic drag force (N)."""
-        return 0.5 * self.rho * self.drag_coeff * self.frontal_area * speed**2
+        return forces.drag_force(speed, self.drag_coeff, self.frontal_area, self.rho)
+
+    def downforce(self, speed: float) -> float:
+        """Aerodynamic downforce (N)."""
+        return forces.downforce(speed, self.lift_coeff, self.frontal_area, self.rho)
+
+    def rolling_resistance(self, speed: float = 0.0) -> float:
+        """Rolling resistance force (N), including the aerodynamic load at `speed`."""
+        return forces.rolling_resistance(self.mass, self.c_rr, self.downforce(speed))
 
-    def rolling_resistance(self) -> float:
-        """Rolling resistance force (N)."""
-        return self.c_rr * self.mass * 9.81
+    def traction_limit(self, speed: float) -> float:
+        """Largest longitudinal tyre force (N) at `speed`."""
+        return forces.traction_limit(self.mass, self.mu, self.downforce(speed))
 
     def acceleration(self, speed: float) -> float:
         """
-        Compute acceleration at a given speed using:
-        - power‑limited wheel force
+        Compute acceleration at a given speed (scalar or array) using:
+        - power‑limited wheel force, capped by traction
         - drag
         - rolling resistance
         """
-        wheel_force = self.power / max(speed, 1e-3)
-        net_force = wheel_force - self.drag_force(speed) - self.rolling_resistance()
-        return net_force / self.mass
+        return forces.acceleration(speed, self.mass, self.power, self.drag_coeff, self.frontal_area,
+                                   self.rho, self.c_rr, self.lift_coeff, self.mu)
 
 
 # Example usage and plotting
@@ -54,8 +65,8 @@ if __name__ == "__main__":
     speeds_kmh = np.linspace(0, 160, 80)
     speeds_ms = speeds_kmh / 3.6
 
-    drag = [model.drag_force(v) for v in speeds_ms]
-    accel = [model.acceleration(v) for v in speeds_ms]
+    drag = model.drag_force(speeds_ms)
+    accel = model.acceleration(speeds_ms)
 
     # Print example outputs
     print("Physics Model Example:")
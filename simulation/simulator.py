@@ -6,15 +6,83 @@ Simple standalone simulator for straight‑line acceleration.
 
 Uses:
 - dataclass for configuration
-- numpy for numerical simulation
+- numpy for numerical simulation (single runs and batched setup sweeps)
+- Euler, semi-implicit and RK4 integration schemes
 - matplotlib for plotting
 
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import numpy as np
 import matplotlib.pyplot as plt
 
+from simulation import forces
+from utils.backend import kernel
+
+
+# Explicit Euler kernels for an ensemble of N setups (see utils.backend)
+
+_SCALAR_SETUPS = 8    # NumPy fallback: ensembles up to this size use a float recurrence per setup
+
+
+def _euler_numpy(v0, steps, dt, mass, power, drag_coeff, frontal_area, rho):
+    """
+    Small ensembles (a single run) step a plain float recurrence per setup;
+    larger ones advance all setups together with one set of array operations
+    per step. Both spell out forces.acceleration in the loop kernel's
+    operation order, so every backend gives identical results.
+    """
+    half_rho_area = 0.5 * (rho * frontal_area)
+    if v0.size <= _SCALAR_SETUPS:
+        v = np.empty((v0.size, steps))
+        x = np.empty((v0.size, steps))
+        for n in range(v0.size):
+            v[n], x[n] = _euler_scalar(float(v0[n]), steps, dt, float(mass[n]), float(power[n]),
+                                       float(drag_coeff[n]), float(half_rho_area[n]))
+        return v, x
+
+    v = np.zeros((v0.size, steps))
+    x = np.zeros((v0.size, steps))
+    v[:, 0] = v0
+    for i in range(1, steps):
+        u = v[:, i - 1]
+        a = (power / np.maximum(u, 1e-3) - drag_coeff * (half_rho_area * (u * u))) / mass
+        v[:, i] = np.maximum(u + a * dt, 0.0)
+        x[:, i] = x[:, i - 1] + v[:, i] * dt
+    return v, x
+
+
+def _euler_scalar(u, steps, dt, mass, power, drag_coeff, half_rho_area):
+    """One setup's Euler recurrence on Python floats (speeds and distances as lists)."""
+    speeds = [u]
+    distances = [0.0]
+    position = 0.0
+    for _ in range(steps - 1):
+        u = max(u + (power / max(u, 1e-3) - drag_coeff * (half_rho_area * (u * u))) / mass * dt, 0.0)
+        position += u * dt
+        speeds.append(u)
+        distances.append(position)
+    return speeds, distances
+
+
+@kernel(_euler_numpy)
+def _euler(v0, steps, dt, mass, power, drag_coeff, frontal_area, rho):
+    """
+    Explicit Euler loop: v += a(v) dt (clamped at 0), x += v dt. The
+    acceleration is forces.acceleration written out in its operation order.
+    """
+    v = np.zeros((v0.size, steps))
+    x = np.zeros((v0.size, steps))
+    for n in range(v0.size):
+        v[n, 0] = v0[n]
+        half_rho_area = 0.5 * (rho[n] * frontal_area[n])
+        for i in range(1, steps):
+            u = v[n, i - 1]
+            a = (power[n] / max(u, 1e-3) - drag_coeff[n] * (half_rho_area * (u * u))) / mass[n]
+            v[n, i] = max(u + a * dt, 0.0)
+            x[n, i] = x[n, i - 1] + v[n, i] * dt
+    return v, x
+
 
 @dataclass
 class SimpleSimulator:
@@ -25,33 +93,119 @@ class SimpleSimulator:
     rho: float = 1.225             # air density
     duration: float = 10.0         # seconds
     dt: float = 0.1                # timestep
+    scheme: str = "euler"          # "euler", "semi-implicit" or "rk4"
+
+    _STEPPERS = {
+        "euler": None,  # handled by the _euler kernel
+        "semi-implicit": "_step_semi_implicit",
+        "rk4": "_step_rk4",
+    }
 
     def drag_force(self, speed: float) -> float:
         """Aerodynamic drag force (N)."""
-        return 0.5 * self.rho * self.drag_coeff * self.frontal_area * speed**2
+        return forces.drag_force(speed, self.drag_coeff, self.frontal_area, self.rho)
 
     def acceleration(self, speed: float) -> float:
         """Compute acceleration at a given speed."""
-        wheel_force = self.power / max(speed, 1e-3)
-        net_force = wheel_force - self.drag_force(speed)
-        return net_force / self.mass
+        return forces.acceleration(speed, self.mass, self.power, self.drag_coeff,
+                                   self.frontal_area, self.rho)
 
     def run(self):
         """Run the simulation and return time, speed, distance arrays."""
-        steps = int(self.duration / self.dt) + 1
+        t, v, x = self.run_batch()
+        return t, v[0], x[0]
+
+    def run_batch(self, mass=None, power=None, drag_coeff=None, frontal_area=None, rho=None,
+                  v0=0.0):
+        """
+        Integrate an ensemble of N setups and initial speeds in lockstep.
+
+        Any parameter, including the initial speed `v0`, may be given as an
+        array of shape (N,); parameters left as None keep this simulator's
+        value. All arrays are broadcast together and every time step advances
+        the whole ensemble with one set of NumPy operations using `scheme`.
+
+        Returns:
+            t of shape (steps,), and speed and distance arrays of shape (N, steps).
+        """
+        if self.scheme not in self._STEPPERS:
+            raise ValueError(f"Unknown scheme '{self.scheme}', expected one of {sorted(self._STEPPERS)}")
+
+        overrides = {
+            "mass": mass,
+            "power": power,
+            "drag_coeff": drag_coeff,
+            "frontal_area": frontal_area,
+            "rho": rho,
+        }
+        params = {name: getattr(self, name) if value is None else value
+                  for name, value in overrides.items()}
+        *arrays, v_start = (np.array(a) for a in np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(p, dtype=float)) for p in [*params.values(), v0])))
+        batch = replace(self, **dict(zip(params, arrays)))
 
+        steps = int(self.duration / self.dt) + 1
         t = np.linspace(0, self.duration, steps)
-        v = np.zeros(steps)
-        x = np.zeros(steps)
+
+        if self.scheme == "euler":
+            v, x = _euler(v_start, steps, self.dt, batch.mass, batch.power,
+                          batch.drag_coeff, batch.frontal_area, batch.rho)
+            return t, v, x
+
+        step = getattr(batch, self._STEPPERS[self.scheme])
+        n = v_start.shape[0]
+        v = np.zeros((n, steps))
+        x = np.zeros((n, steps))
+        v[:, 0] = v_start
 
         for i in range(1, steps):
-            a = self.acceleration(v[i - 1])
-            v[i] = v[i - 1] + a * self.dt
-            v[i] = max(v[i], 0.0)
-            x[i] = x[i - 1] + v[i] * self.dt
+            v[:, i], x[:, i] = step(v[:, i - 1], x[:, i - 1], self.dt)
 
         return t, v, x
 
+    # Integration schemes (all operate on arrays of shape (N,))
+
+    def _specific_power(self, v):
+        """
+        Rate of change of specific kinetic energy e = v²/2 (W/kg). Evaluated
+        at the same 1e-3 m/s floor as the wheel force, so it tends to P/m at rest.
+        """
+        v = np.maximum(v, 1e-3)
+        return v * self.acceleration(v)
+
+    def _step_semi_implicit(self, v, x, dt):
+        """
+        Energy-form step with the drag term treated implicitly:
+            e' = (e + dt * p_drive) / (1 + dt * p_drag / e)
+        Stable for any dt; position uses the trapezoidal speed.
+        """
+        e = 0.5 * v**2
+        p_drag = v * self.drag_force(v) / self.mass
+        p_drive = self._specific_power(v) + p_drag
+        damping = np.divide(p_drag, e, out=np.zeros_like(e), where=e > 0)
+        e_new = (e + dt * p_drive) / (1.0 + dt * damping)
+        v_new = np.sqrt(np.maximum(2.0 * e_new, 0.0))
+        return v_new, x + 0.5 * (v + v_new) * dt
+
+    def _step_rk4(self, v, x, dt):
+        """Classic RK4 on (x, e) with e = v²/2, which removes the 1/v singularity at rest."""
+        def speed(e):
+            return np.sqrt(np.maximum(2.0 * e, 0.0))
+
+        e = 0.5 * v**2
+        v1 = v
+        k1 = self._specific_power(v1)
+        v2 = speed(e + 0.5 * dt * k1)
+        k2 = self._specific_power(v2)
+        v3 = speed(e + 0.5 * dt * k2)
+        k3 = self._specific_power(v3)
+        v4 = speed(e + dt * k3)
+        k4 = self._specific_power(v4)
+
+        e_new = np.maximum(e + dt / 6.0 * (k1 + 2 * k2 + 2 * k3 + k4), 0.0)
+        x_new = x + dt / 6.0 * (v1 + 2 * v2 + 2 * v3 + v4)
+        return speed(e_new), x_new
+
 
 # Example usage and plotting
 
@@ -64,6 +218,15 @@ if __name__ == "__main__":
     print(f"Final speed: {v[-1]:.2f} m/s ({v[-1] * 3.6:.1f} km/h)")
     print(f"Distance covered: {x[-1]:.1f} m")
 
+    # RK4 stays accurate at a 5x larger time step
+    _, v_rk4, x_rk4 = SimpleSimulator(duration=12.0, dt=0.5, scheme="rk4").run()
+    print(f"RK4 (dt=0.5 s) final speed: {v_rk4[-1] * 3.6:.1f} km/h, distance: {x_rk4[-1]:.1f} m")
+
+    # Batched setup sweep: 1,000 power levels in one call
+    powers = np.linspace(60_000.0, 90_000.0, 1000)
+    _, v_batch, x_batch = replace(sim, scheme="rk4").run_batch(power=powers)
+    print(f"Sweep distance range: {x_batch[:, -1].min():.1f}–{x_batch[:, -1].max():.1f} m")
+
     # Plot speed vs time
     plt.figure(figsize=(8, 4))
     plt.plot(t, v * 3.6, label="Speed (km/h)")
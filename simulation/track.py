@@ -7,14 +7,65 @@ This version supports:
 - Straight segments
 - Corner segments with radius
 - Total track length calculation
+- Compiled, cached distance-indexed geometry (curvature, heading, XY)
 - Example usage with plotting of track layout (top‑down view)
 
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import numpy as np
 import matplotlib.pyplot as plt
 
+from utils.backend import kernel
+
+
+# Layout kernels (see utils.backend)
+
+CORNER_STEPS = 50
+
+
+def _layout_numpy(lengths, is_corner, radii, directions):
+    """Vectorized layout: one point per straight, CORNER_STEPS points per corner."""
+    counts = np.where(is_corner, CORNER_STEPS, 1)
+    seg = np.repeat(np.arange(lengths.size), counts)
+    j = np.arange(seg.size) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    corner = is_corner[seg]
+    radius = np.where(corner, radii[seg], 1.0)
+    arc = np.where(corner, lengths[seg] / radius, 0.0)
+    turn = np.where(corner, arc * j / (CORNER_STEPS - 1) * directions[seg] / CORNER_STEPS, 0.0)
+    step = np.where(corner, radius / CORNER_STEPS, lengths[seg])
+
+    heading = np.cumsum(turn)
+    x = np.concatenate(([0.0], np.cumsum(step * np.cos(heading))))
+    y = np.concatenate(([0.0], np.cumsum(step * np.sin(heading))))
+    return x, y
+
+
+@kernel(_layout_numpy)
+def _layout(lengths, is_corner, radii, directions):
+    """Top-down layout loop: straights move along the heading, corners turn in steps."""
+    n = 1
+    for i in range(lengths.size):
+        n += CORNER_STEPS if is_corner[i] else 1
+    x = np.zeros(n)
+    y = np.zeros(n)
+    heading = 0.0
+    k = 0
+    for i in range(lengths.size):
+        if is_corner[i]:
+            arc = lengths[i] / radii[i]
+            for j in range(CORNER_STEPS):
+                heading += arc * j / (CORNER_STEPS - 1) * directions[i] / CORNER_STEPS
+                x[k + 1] = x[k] + (radii[i] / CORNER_STEPS) * np.cos(heading)
+                y[k + 1] = y[k] + (radii[i] / CORNER_STEPS) * np.sin(heading)
+                k += 1
+        else:
+            x[k + 1] = x[k] + lengths[i] * np.cos(heading)
+            y[k + 1] = y[k] + lengths[i] * np.sin(heading)
+            k += 1
+    return x, y
+
 
 @dataclass
 class TrackSegment:
@@ -24,14 +75,83 @@ class TrackSegment:
     direction: int = 1         # +1 = left, -1 = right (for corners)
 
 
+@dataclass(frozen=True, eq=False)
+class CompiledTrack:
+    """
+    Immutable, distance-indexed discretization of a track.
+
+    All arrays have one entry per station and are read-only. Curvature is
+    signed (+ = left) and applies to the interval starting at each station.
+    Instances compare and hash by identity (field-wise == is ambiguous on arrays).
+    """
+    ds: float                  # nominal station spacing (m)
+    distance: np.ndarray       # station distance along the centerline (m)
+    curvature: np.ndarray      # 1/m
+    heading: np.ndarray        # radians
+    x: np.ndarray              # m
+    y: np.ndarray              # m
+
+    @classmethod
+    def from_segments(cls, segments: list, ds: float) -> "CompiledTrack":
+        """Discretize segments so every segment boundary falls on a station."""
+        lengths = np.array([seg.length for seg in segments], dtype=float)
+        kappa = np.array([seg.direction / seg.radius if seg.segment_type == "corner" else 0.0
+                          for seg in segments], dtype=float)
+        counts = np.maximum(np.ceil(lengths / ds).astype(int), 1)
+
+        step = np.repeat(lengths / counts, counts)
+        step_kappa = np.repeat(kappa, counts)
+        turn = step_kappa * step
+
+        distance = np.concatenate(([0.0], np.cumsum(step)))
+        heading = np.concatenate(([0.0], np.cumsum(turn)))
+
+        # Exact chord of each constant-curvature interval
+        chord = step * np.sinc(turn / (2 * np.pi))
+        mid_heading = heading[:-1] + 0.5 * turn
+        x = np.concatenate(([0.0], np.cumsum(chord * np.cos(mid_heading))))
+        y = np.concatenate(([0.0], np.cumsum(chord * np.sin(mid_heading))))
+        curvature = np.append(step_kappa, step_kappa[-1:] if step_kappa.size else 0.0)
+
+        arrays = [distance, curvature, heading, x, y]
+        for arr in arrays:
+            arr.flags.writeable = False
+        return cls(ds, *arrays)
+
+    @property
+    def length(self) -> float:
+        return float(self.distance[-1])
+
+    def __len__(self) -> int:
+        return self.distance.size
+
+
 @dataclass
 class Track:
     segments: list
+    _compiled: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _signature: tuple = field(default=None, init=False, repr=False, compare=False)
 
     def total_length(self) -> float:
         """Return total track length in meters."""
         return sum(seg.length for seg in self.segments)
 
+    def compile(self, ds: float = 1.0) -> CompiledTrack:
+        """
+        Return the distance-indexed geometry at spacing `ds`.
+
+        Results are cached per spacing and the cache is dropped whenever the
+        segment list or any segment's parameters change.
+        """
+        signature = tuple((seg.length, seg.segment_type, seg.radius, seg.direction)
+                          for seg in self.segments)
+        if signature != self._signature:
+            self._compiled.clear()
+            self._signature = signature
+        if ds not in self._compiled:
+            self._compiled[ds] = CompiledTrack.from_segments(self.segments, ds)
+        return self._compiled[ds]
+
     def generate_xy(self):
         """
         Generate a simple 2D top‑down layout of the track.
@@ -39,32 +159,15 @@ class Track:
         Returns:
             x, y arrays representing the track path.
         """
-        x = [0.0]
-        y = [0.0]
-        heading = 0.0  # radians
-
-        for seg in self.segments:
-            if seg.segment_type == "straight":
-                # Move forward in the current heading
-                dx = seg.length * np.cos(heading)
-                dy = seg.length * np.sin(heading)
-                x.append(x[-1] + dx)
-                y.append(y[-1] + dy)
-
-            elif seg.segment_type == "corner":
-                # Approximate corner with small steps
-                steps = 50
-                arc = seg.length / seg.radius
-                angles = np.linspace(0, arc, steps) * seg.direction
-
-                for a in angles:
-                    heading += a / steps
-                    dx = (seg.radius / steps) * np.cos(heading)
-                    dy = (seg.radius / steps) * np.sin(heading)
-                    x.append(x[-1] + dx)
-                    y.append(y[-1] + dy)
-
-        return np.array(x), np.array(y)
+        corner = np.array([seg.segment_type == "corner" for seg in self.segments], dtype=bool)
+        radii = np.array([seg.radius if seg.segment_type == "corner" else 1.0
+                          for seg in self.segments], dtype=float)
+        return _layout(
+            np.array([seg.length for seg in self.segments], dtype=float),
+            corner,
+            radii,
+            np.array([seg.direction for seg in self.segments], dtype=float),
+        )
 
 
 # Example usage and plotting
@@ -82,6 +185,8 @@ if __name__ == "__main__":
 
     # Generate layout
     x, y = track.generate_xy()
+    compiled = track.compile(ds=0.5)
+    print(f"Compiled stations: {len(compiled)} (final heading {np.degrees(compiled.heading[-1]):.1f}°)")
 
     # Plot track layout
     plt.figure(figsize=(6, 6))
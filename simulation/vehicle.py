@@ -14,6 +14,8 @@ from dataclasses import dataclass
 import numpy as np
 import matplotlib.pyplot as plt
 
+from simulation import forces
+
 
 @dataclass
 class Vehicle:
@@ -25,13 +27,12 @@ class Vehicle:
 
     def drag_force(self, speed: float) -> float:
         """Aerodynamic drag force (N)."""
-        return 0.5 * self.rho * self.drag_coeff * self.frontal_area * speed**2
+        return forces.drag_force(speed, self.drag_coeff, self.frontal_area, self.rho)
 
     def acceleration(self, speed: float) -> float:
-        """Compute acceleration at a given speed."""
-        wheel_force = self.power / max(speed, 1e-3)
-        net_force = wheel_force - self.drag_force(speed)
-        return net_force / self.mass
+        """Compute acceleration at a given speed (scalar or array)."""
+        return forces.acceleration(speed, self.mass, self.power, self.drag_coeff,
+                                   self.frontal_area, self.rho)
 
 
 # Example usage and plotting
@@ -42,7 +43,7 @@ if __name__ == "__main__":
     speeds_kmh = np.linspace(0, 160, 60)
     speeds_ms = speeds_kmh / 3.6
 
-    accels = [car.acceleration(v) for v in speeds_ms]
+    accels = car.acceleration(speeds_ms)
 
     print("=== Vehicle Example ===")
     for v in [20, 60, 100]:
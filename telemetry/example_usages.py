@@ -12,10 +12,10 @@ Runs all modules inside the telemetry folder:
 
 import numpy as np
 
-from generator import TelemetryGenerator
-from plots import TelemetryPlots
-from analysis import TelemetryAnalysis
-from export import TelemetryExport
+from telemetry.generator import TelemetryGenerator
+from telemetry.plots import TelemetryPlots
+from telemetry.analysis import TelemetryAnalysis
+from telemetry.export import TelemetryExport
 
 
 def main():
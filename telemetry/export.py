@@ -2,12 +2,34 @@
 
 """
 
-Module for exporting telemetry data to CSV or JSON.
+Module for exporting telemetry data to CSV, JSON, or a columnar binary format,
+plus chunked streaming writers for CSV and JSON Lines (optionally gzip/lzma).
+
+Binary layout (all integers little-endian):
+- 8-byte magic b"FSAETLM1"
+- uint64 header length, followed by a UTF-8 JSON header
+  {"version", "samples", "sample_rate", "channels": [{"name", "dtype", "unit", "offset", "nbytes"}]}
+- one contiguous little-endian block per channel at its absolute `offset`,
+  every block aligned to 64 bytes
 
 """
 
 import csv
+import gzip
 import json
+import lzma
+import math
+import time
+
+import numpy as np
+
+BINARY_MAGIC = b"FSAETLM1"
+BINARY_ALIGN = 64
+
+
+def _aligned(offset):
+    return -(-offset // BINARY_ALIGN) * BINARY_ALIGN
+
 
 class TelemetryExport:
 
@@ -29,6 +51,208 @@ class TelemetryExport:
         with open(filename, "w") as f:
             json.dump(data, f, indent=4)
 
+    @staticmethod
+    def to_binary(filename, channels: dict, units: dict = None, sample_rate: float = None) -> dict:
+        """
+        Write equal-length 1-D channels {name: array} in the columnar binary format.
+
+        Each channel is written with a single tofile() call in its own dtype
+        (converted to little-endian if needed).
+
+        Returns:
+            dict with bytes written, elapsed seconds and throughput (MB/s).
+        """
+        start = time.perf_counter()
+        units = units or {}
+        arrays = {name: np.ascontiguousarray(np.asarray(values)) for name, values in channels.items()}
+        lengths = {a.shape[0] for a in arrays.values()}
+        if len(lengths) > 1 or any(a.ndim != 1 for a in arrays.values()):
+            raise ValueError("All channels must be 1-D arrays of the same length")
+        arrays = {name: a.astype(a.dtype.newbyteorder("<"), copy=False) for name, a in arrays.items()}
+        samples = lengths.pop() if lengths else 0
+
+        # Header size depends on the offsets it contains; widen until it fits
+        header_room = BINARY_ALIGN
+        while True:
+            offset = _aligned(len(BINARY_MAGIC) + 8 + header_room)
+            entries = []
+            for name, a in arrays.items():
+                entries.append({"name": name, "dtype": a.dtype.str, "unit": units.get(name, ""),
+                                "offset": offset, "nbytes": a.nbytes})
+                offset = _aligned(offset + a.nbytes)
+            header = json.dumps({
+                "version": 1,
+                "samples": samples,
+                "sample_rate": sample_rate,
+                "channels": entries,
+            }).encode()
+            if len(header) <= header_room:
+                break
+            header_room = _aligned(len(header))
+
+        with open(filename, "wb") as f:
+            f.write(BINARY_MAGIC)
+            f.write(np.uint64(header_room).astype("<u8").tobytes())
+            f.write(header.ljust(header_room))
+            for entry, a in zip(entries, arrays.values()):
+                f.seek(entry["offset"])
+                a.tofile(f)
+            f.truncate(offset)
+        written = offset
+
+        elapsed = time.perf_counter() - start
+        return {
+            "bytes": written,
+            "seconds": elapsed,
+            "mb_per_s": written / 1e6 / elapsed if elapsed else float("inf"),
+        }
+
+    @staticmethod
+    def read_binary_header(filename) -> dict:
+        """Read only the JSON header of a columnar binary file."""
+        with open(filename, "rb") as f:
+            if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+                raise ValueError(f"{filename} is not a telemetry binary file")
+            size = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+            return json.loads(f.read(size))
+
+    @staticmethod
+    def from_binary(filename) -> dict:
+        """Read every channel of a columnar binary file back into arrays (no parsing)."""
+        header = TelemetryExport.read_binary_header(filename)
+        channels = {}
+        for entry in header["channels"]:
+            dtype = np.dtype(entry["dtype"])
+            channels[entry["name"]] = np.fromfile(filename, dtype=dtype,
+                                                  count=entry["nbytes"] // dtype.itemsize,
+                                                  offset=entry["offset"])
+        return channels
+
+
+class StreamWriter:
+    """
+    Base class for chunked text writers with constant memory use.
+
+    Chunks are either a mapping {column: 1-D array} or a 2-D array of shape
+    (len(columns), samples). Formatted text is buffered and written out once
+    `flush_bytes` characters are pending or `flush_interval` seconds have
+    passed since the last flush, so readers can tail the file.
+    """
+
+    OPENERS = {
+        None: lambda filename: open(filename, "w", newline=""),
+        "gzip": lambda filename: gzip.open(filename, "wt", compresslevel=6, newline=""),
+        "lzma": lambda filename: lzma.open(filename, "wt", newline=""),
+    }
+
+    def __init__(self, filename, columns, compression=None,
+                 flush_bytes: int = 1 << 20, flush_interval: float = 1.0):
+        if compression not in self.OPENERS:
+            raise ValueError(f"Unknown compression '{compression}', expected one of {list(self.OPENERS)}")
+        self.columns = list(columns)
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.chars_written = 0
+        self._pending = []
+        self._pending_chars = 0
+        self._last_flush = time.monotonic()
+        self._file = self.OPENERS[compression](filename)
+        self._start()
+
+    def _start(self):
+        """Hook for writing a file header."""
+
+    def _format(self, columns) -> str:
+        raise NotImplementedError
+
+    def write(self, chunk):
+        """Format one chunk of samples and flush if a threshold is reached."""
+        if isinstance(chunk, dict):
+            cols = [np.asarray(chunk[name]) for name in self.columns]
+        else:
+            cols = list(np.asarray(chunk))
+            if len(cols) != len(self.columns):
+                raise ValueError(f"Expected {len(self.columns)} channels, got {len(cols)}")
+        if not len(cols[0]):
+            return
+
+        text = self._format([c.tolist() for c in cols])
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        self.rows_written += len(cols[0])
+
+        if (self._pending_chars >= self.flush_bytes
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Write all pending text and flush the underlying file."""
+        if self._pending:
+            self._file.write("".join(self._pending))
+            self.chars_written += self._pending_chars
+            self._pending.clear()
+            self._pending_chars = 0
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _csv_field(value) -> str:
+    """Quote a text field the way csv.writer does (QUOTE_MINIMAL)."""
+    text = str(value)
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+class CSVStreamWriter(StreamWriter):
+    """
+    Streaming CSV writer: one header row, then one row per sample. Numbers
+    are written with str(); text fields are quoted as by csv.writer.
+    """
+
+    def _start(self):
+        self._pending.append(",".join(map(_csv_field, self.columns)) + "\n")
+        self._pending_chars += len(self._pending[0])
+
+    def _format(self, columns) -> str:
+        fields = [map(str, c) if isinstance(c[0], (int, float)) else map(_csv_field, c)
+                  for c in columns]
+        return "".join(",".join(row) + "\n" for row in zip(*fields))
+
+
+def _json_value(value) -> str:
+    """Encode one sample as JSON; NaN and infinities (dropouts) become null."""
+    if type(value) is float:
+        return repr(value) if math.isfinite(value) else "null"
+    if type(value) is int:
+        return str(value)
+    return json.dumps(value)
+
+
+class JSONLinesStreamWriter(StreamWriter):
+    """Streaming JSON Lines writer: one JSON object per sample."""
+
+    def _start(self):
+        # Braces in column names must not be read as format fields
+        keys = ", ".join(json.dumps(name).replace("{", "{{").replace("}", "}}") + ": {}"
+                         for name in self.columns)
+        self._template = "{{" + keys + "}}\n"
+
+    def _format(self, columns) -> str:
+        encoded = [map(_json_value, c) for c in columns]
+        return "".join(self._template.format(*row) for row in zip(*encoded))
+
 
 # Example usage
 
@@ -43,4 +267,16 @@ if __name__ == "__main__":
     print("Telemetry Export Example:")
     TelemetryExport.to_csv("telemetry.csv", laps, lap_times, speeds, fuel_use, tire_wear)
     TelemetryExport.to_json("telemetry.json", laps, lap_times, speeds, fuel_use, tire_wear)
-    print("Data exported to telemetry.csv and telemetry.json")
+    stats = TelemetryExport.to_binary(
+        "telemetry.bin",
+        {"lap": laps, "lap_time": lap_times, "speed": speeds, "fuel": fuel_use, "tire_wear": tire_wear},
+        units={"lap_time": "s", "speed": "km/h", "fuel": "L"},
+    )
+    print("Data exported to telemetry.csv, telemetry.json and telemetry.bin "
+          f"({stats['bytes']} bytes, {stats['mb_per_s']:.1f} MB/s)")
+
+    columns = ["lap", "lap_time", "speed"]
+    with JSONLinesStreamWriter("telemetry.jsonl.gz", columns, compression="gzip") as writer:
+        for start in range(0, 5, 2):
+            writer.write(np.vstack([laps, lap_times, speeds])[:, start:start + 2])
+    print(f"Streamed {writer.rows_written} rows to telemetry.jsonl.gz")
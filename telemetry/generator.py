@@ -3,13 +3,17 @@
 """
 
 Synthetic telemetry generator for FSAE laps/sessions.
-Produces lap times, speeds, fuel usage, and tire wear traces.
+Produces lap times, speeds, fuel usage, and tire wear traces, either as
+whole-session lap arrays or as a bounded-memory stream of sample chunks.
 
 """
 
 from dataclasses import dataclass
 import numpy as np
 
+# Channel order of the rows yielded by TelemetryGenerator.stream
+CHANNELS = ("time", "lap", "speed", "fuel", "tire_wear")
+
 @dataclass
 class TelemetryGenerator:
     laps: int
@@ -24,6 +28,58 @@ class TelemetryGenerator:
         tire_wear = np.linspace(0, 1, self.laps)
         return lap_times, speeds, fuel_use, tire_wear
 
+    def stream(self, sample_rate: float = 100.0, chunk_size: int = 65536,
+               dtype=np.float64, seed=None, corners: int = 4):
+        """
+        Yield sample-level telemetry in chunks of shape (len(CHANNELS), chunk_size).
+
+        Laps are drawn lazily (lap time ~ N(75, 2) s, mean speed as in
+        `generate`) and speed follows a per-lap profile with one dip per
+        corner plus sample noise. Only the laps overlapping the current chunk
+        are held in memory. Lap draws and sample noise use separate random
+        streams, so the output for a given seed is identical for any
+        `chunk_size`. The final chunk is shorter when the session ends.
+        """
+        lap_rng, noise_rng = (np.random.default_rng(s)
+                              for s in np.random.SeedSequence(seed).spawn(2))
+        top = self.max_speed
+
+        lap = 0
+        lap_start = 0.0
+        lap_time = lap_rng.normal(75, 2)
+        lap_speed = lap_rng.normal(top * 0.8, 10)
+        sample = 0
+
+        while lap < self.laps:
+            t = (sample + np.arange(chunk_size)) / sample_rate
+
+            # Laps touched by this chunk: (index, start time, duration, mean speed)
+            laps = [(lap, lap_start, lap_time, lap_speed)]
+            while lap_start + lap_time <= t[-1] and lap < self.laps:
+                lap += 1
+                lap_start += lap_time
+                lap_time = lap_rng.normal(75, 2)
+                lap_speed = lap_rng.normal(top * 0.8, 10)
+                laps.append((lap, lap_start, lap_time, lap_speed))
+            index, start, duration, mean_speed = (np.array(col) for col in zip(*laps))
+
+            k = np.searchsorted(start, t, side="right") - 1
+            n = np.searchsorted(index[k], self.laps)  # samples before the session ends
+            t, k = t[:n], k[:n]
+            phase = (t - start[k]) / duration[k]
+            progress = (index[k] + phase) / self.laps
+
+            chunk = np.empty((len(CHANNELS), n), dtype=dtype)
+            chunk[0] = t
+            chunk[1] = index[k]
+            chunk[2] = np.clip(mean_speed[k] - 0.2 * top * np.cos(2 * np.pi * corners * phase)
+                               + noise_rng.normal(0, 1.0, n), 0.0, top)
+            chunk[3] = self.fuel_capacity * progress
+            chunk[4] = progress
+            sample += n
+            if n:
+                yield chunk
+
 
 # Example usage
 
@@ -36,3 +92,10 @@ if __name__ == "__main__":
     print(f"Speeds (first 5) → {speeds[:5]}")
     print(f"Fuel Used Final → {fuel_use[-1]:.1f} L")
     print(f"Tire Wear Final → {tire_wear[-1]:.2f}")
+
+    samples = 0
+    peak = 0
+    for chunk in gen.stream(sample_rate=1000.0, chunk_size=100_000, dtype=np.float32, seed=7):
+        samples += chunk.shape[1]
+        peak = max(peak, chunk.nbytes)
+    print(f"Streamed {samples} samples at 1 kHz ({peak / 1e6:.1f} MB per chunk)")
@@ -0,0 +1,376 @@
+#ingest.py
+
+"""
+
+Live telemetry ingest over UDP or TCP built on asyncio.
+Fixed-layout binary frames are decoded with NumPy into (channels, samples)
+blocks in CHANNELS order and pushed into a bounded in-memory buffer with a
+configurable backpressure policy. A replay sender streams
+TelemetryGenerator output so the whole path can be exercised on localhost.
+
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import time
+
+import numpy as np
+
+from telemetry.generator import CHANNELS, TelemetryGenerator
+
+# One frame on the wire: a sequence number followed by one sample of every
+# channel, little-endian and packed. A packet carries one or more frames.
+FRAME_DTYPE = np.dtype([
+    ("seq", "<u4"),
+    ("time", "<f8"),
+    ("lap", "<u2"),
+    ("speed", "<f4"),
+    ("fuel", "<f4"),
+    ("tire_wear", "<f4"),
+])
+
+POLICIES = ("drop_oldest", "block")
+
+
+def encode_frames(chunk: np.ndarray, first_seq: int = 0) -> bytes:
+    """Pack a (len(CHANNELS), n) chunk into n consecutive frames."""
+    frames = np.empty(chunk.shape[1], dtype=FRAME_DTYPE)
+    frames["seq"] = (first_seq + np.arange(chunk.shape[1])) % (1 << 32)
+    for name, row in zip(CHANNELS, chunk):
+        frames[name] = row
+    return frames.tobytes()
+
+
+def decode_frames(data):
+    """
+    Decode the whole frames in a bytes-like object.
+
+    Returns:
+        seq:   (n,) uint32 frame sequence numbers
+        block: (len(CHANNELS), n) float64 channel array
+    """
+    frames = np.frombuffer(data, dtype=FRAME_DTYPE, count=len(data) // FRAME_DTYPE.itemsize)
+    block = np.empty((len(CHANNELS), frames.size))
+    for row, name in zip(block, CHANNELS):
+        row[:] = frames[name]
+    return frames["seq"], block
+
+
+@dataclass
+class IngestStats:
+    frames: int = 0
+    packets: int = 0
+    bytes: int = 0
+    dropped: int = 0              # frames discarded by the buffer policy
+    lost: int = 0                 # frames missing from the sequence numbers
+    decode_seconds: float = 0.0   # total time spent decoding
+    max_decode_latency: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def frames_per_s(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.frames / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mean_decode_latency(self) -> float:
+        """Mean decode time per packet (s)."""
+        return self.decode_seconds / self.packets if self.packets else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "packets": self.packets,
+            "bytes": self.bytes,
+            "dropped": self.dropped,
+            "lost": self.lost,
+            "frames_per_s": self.frames_per_s,
+            "mean_decode_latency": self.mean_decode_latency,
+            "max_decode_latency": self.max_decode_latency,
+        }
+
+
+class IngestBuffer:
+    """
+    Bounded FIFO of decoded (channels, n) blocks, holding at most `capacity`
+    samples.
+
+    policy="drop_oldest": new samples always go in; the oldest samples are
+                          discarded to make room.
+    policy="block":       `put` waits until consumers free enough room, which
+                          backpressures TCP senders. `put_nowait` cannot wait,
+                          so it drops the new samples instead (used for UDP).
+    """
+
+    def __init__(self, capacity: int = 1 << 16, policy: str = "drop_oldest"):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}', expected one of {POLICIES}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.policy = policy
+        self._blocks = deque()
+        self._size = 0
+        self._readable = asyncio.Event()   # set when a block is appended
+        self._writable = asyncio.Event()   # set when samples are removed
+
+    def __len__(self):
+        return self._size
+
+    def put_nowait(self, block: np.ndarray) -> int:
+        """Add a block without waiting; returns the number of samples dropped."""
+        n = block.shape[-1]
+        if self.policy == "block":
+            if self._size + n > self.capacity:
+                return n
+            self._append(block)
+            return 0
+
+        dropped = 0
+        if n > self.capacity:
+            dropped += n - self.capacity
+            block = block[..., -self.capacity:]
+            n = self.capacity
+        while self._size + n > self.capacity:
+            dropped += self._evict(self._size + n - self.capacity)
+        self._append(block)
+        return dropped
+
+    async def put(self, block: np.ndarray) -> int:
+        """Add a block, waiting for room under the "block" policy; returns samples dropped."""
+        if self.policy == "drop_oldest":
+            return self.put_nowait(block)
+        # Blocks larger than the whole buffer are fed in capacity-sized pieces
+        for start in range(0, block.shape[-1], self.capacity):
+            piece = block[..., start:start + self.capacity]
+            while self._size + piece.shape[-1] > self.capacity:
+                self._writable.clear()
+                await self._writable.wait()
+            self._append(piece)
+        return 0
+
+    def get_nowait(self):
+        """Oldest block, or None when the buffer is empty."""
+        if not self._blocks:
+            return None
+        block = self._blocks.popleft()
+        self._size -= block.shape[-1]
+        self._writable.set()
+        return block
+
+    async def get(self) -> np.ndarray:
+        """Wait for and return the oldest block."""
+        while not self._blocks:
+            self._readable.clear()
+            await self._readable.wait()
+        return self.get_nowait()
+
+    def drain(self) -> np.ndarray:
+        """Remove everything buffered and return it as one (channels, n) array."""
+        blocks = list(self._blocks)
+        self._blocks.clear()
+        self._size = 0
+        self._writable.set()
+        if not blocks:
+            return np.empty((len(CHANNELS), 0))
+        return np.concatenate(blocks, axis=-1)
+
+    def _append(self, block):
+        if block.shape[-1]:
+            self._blocks.append(block)
+            self._size += block.shape[-1]
+            self._readable.set()
+
+    def _evict(self, count) -> int:
+        """Discard up to `count` of the oldest samples."""
+        head = self._blocks[0]
+        if head.shape[-1] <= count:
+            self._blocks.popleft()
+            removed = head.shape[-1]
+        else:
+            self._blocks[0] = head[..., count:]
+            removed = count
+        self._size -= removed
+        return removed
+
+
+class _DatagramIngest(asyncio.DatagramProtocol):
+
+    def __init__(self, server):
+        self.server = server
+
+    def datagram_received(self, data, addr):
+        block = self.server._decode(data, addr)
+        self.server.stats.dropped += self.server.buffer.put_nowait(block)
+
+
+class IngestServer:
+    """
+    Receives telemetry frames on `host:port` and pushes decoded blocks into
+    `buffer`. Over UDP each datagram holds whole frames; over TCP frames are
+    reassembled from the byte stream. Port 0 picks a free port.
+    """
+
+    def __init__(self, buffer: IngestBuffer, host: str = "127.0.0.1", port: int = 0,
+                 protocol: str = "udp"):
+        if protocol not in ("udp", "tcp"):
+            raise ValueError(f"Unknown protocol '{protocol}', expected 'udp' or 'tcp'")
+        self.buffer = buffer
+        self.host = host
+        self.port = port
+        self.protocol = protocol
+        self.stats = IngestStats()
+        self._expected = {}   # next sequence number per source
+        self._transport = None
+        self._server = None
+
+    async def start(self):
+        """Start listening; returns the bound (host, port)."""
+        loop = asyncio.get_running_loop()
+        self.stats = IngestStats()
+        if self.protocol == "udp":
+            self._transport, _ = await loop.create_datagram_endpoint(
+                lambda: _DatagramIngest(self), local_addr=(self.host, self.port))
+            address = self._transport.get_extra_info("sockname")
+        else:
+            self._server = await asyncio.start_server(self._handle_stream, self.host, self.port)
+            address = self._server.sockets[0].getsockname()
+        self.host, self.port = address[:2]
+        return self.host, self.port
+
+    async def close(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _handle_stream(self, reader, writer):
+        size = FRAME_DTYPE.itemsize
+        source = writer.get_extra_info("peername")
+        pending = b""
+        try:
+            while data := await reader.read(size * 1024):
+                pending += data
+                whole = len(pending) - len(pending) % size
+                if whole:
+                    block = self._decode(pending[:whole], source)
+                    pending = pending[whole:]
+                    self.stats.dropped += await self.buffer.put(block)
+        finally:
+            writer.close()
+
+    def _decode(self, data, source) -> np.ndarray:
+        start = time.perf_counter()
+        seq, block = decode_frames(data)
+        elapsed = time.perf_counter() - start
+
+        stats = self.stats
+        stats.packets += 1
+        stats.bytes += len(data)
+        stats.frames += seq.size
+        stats.decode_seconds += elapsed
+        stats.max_decode_latency = max(stats.max_decode_latency, elapsed)
+
+        if seq.size:
+            # Gaps in the (wrapping) sequence; large jumps are reordering, not loss
+            previous = np.uint32((self._expected.get(source, int(seq[0])) - 1) % (1 << 32))
+            steps = np.diff(seq, prepend=previous) - np.uint32(1)
+            stats.lost += int(steps[steps < (1 << 31)].sum())
+            self._expected[source] = (int(seq[-1]) + 1) % (1 << 32)
+        return block
+
+
+@dataclass
+class ReplaySender:
+    """
+    Stand-in for the car: replays TelemetryGenerator.stream output as frames.
+    speedup=None sends as fast as the loop allows; 1.0 paces in real time.
+    """
+    generator: TelemetryGenerator
+    host: str = "127.0.0.1"
+    port: int = 0
+    protocol: str = "udp"
+    frames_per_packet: int = 64
+    speedup: float = None
+
+    async def run(self, sample_rate: float = 100.0, seed=None) -> int:
+        """Send the whole session; returns the number of frames sent."""
+        loop = asyncio.get_running_loop()
+        if self.protocol == "udp":
+            transport, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol, remote_addr=(self.host, self.port))
+            writer = None
+        else:
+            _, writer = await asyncio.open_connection(self.host, self.port)
+
+        sent = 0
+        start = time.perf_counter()
+        try:
+            for chunk in self.generator.stream(sample_rate=sample_rate, seed=seed):
+                for i in range(0, chunk.shape[1], self.frames_per_packet):
+                    frames = chunk[:, i:i + self.frames_per_packet]
+                    packet = encode_frames(frames, sent)
+                    if writer is None:
+                        transport.sendto(packet)
+                    else:
+                        writer.write(packet)
+                        await writer.drain()
+                    sent += frames.shape[1]
+
+                    if self.speedup:
+                        due = start + frames[0, -1] / self.speedup - time.perf_counter()
+                        await asyncio.sleep(max(due, 0.0))
+                    else:
+                        await asyncio.sleep(0)  # let the receiver run
+        finally:
+            if writer is None:
+                transport.close()
+            else:
+                writer.close()
+                await writer.wait_closed()
+        return sent
+
+
+# Example usage
+
+if __name__ == "__main__":
+
+    async def consume(buffer, totals):
+        while True:
+            block = await buffer.get()
+            totals["samples"] += block.shape[1]
+            totals["peak_speed"] = max(totals["peak_speed"], block[2].max())
+
+    async def demo(protocol, policy):
+        buffer = IngestBuffer(capacity=4096, policy=policy)
+        totals = {"samples": 0, "peak_speed": 0.0}
+        async with IngestServer(buffer, protocol=protocol) as server:
+            consumer = asyncio.create_task(consume(buffer, totals))
+            sender = ReplaySender(TelemetryGenerator(laps=5, max_speed=140, fuel_capacity=20),
+                                  server.host, server.port, protocol=protocol)
+            sent = await sender.run(sample_rate=100.0, seed=3)
+            await asyncio.sleep(0.1)
+            consumer.cancel()
+
+        stats = server.stats
+        print(f"{protocol.upper()} / {policy}: sent {sent}, received {stats.frames}, "
+              f"consumed {totals['samples']}, dropped {stats.dropped}, lost {stats.lost}")
+        print(f"  {stats.frames_per_s:,.0f} frames/s, "
+              f"decode {stats.mean_decode_latency * 1e6:.1f} µs/packet "
+              f"(max {stats.max_decode_latency * 1e6:.1f} µs), "
+              f"peak speed {totals['peak_speed']:.1f} km/h")
+
+    print("Telemetry Ingest Example:")
+    asyncio.run(demo("udp", "drop_oldest"))
+    asyncio.run(demo("tcp", "block"))
@@ -3,36 +3,42 @@
 """
 
 Module for visualizing telemetry data (lap times, fuel, tire wear, speed).
+Every plot returns its Figure; show=False builds it headless through the
+object-oriented API without touching the global pyplot state.
 
 """
 
-import matplotlib.pyplot as plt
+from visualization.render import new_figure, finish
+
 
 class TelemetryPlots:
 
     @staticmethod
-    def plot_lap_times(laps, lap_times):
-        plt.plot(laps, lap_times, color="blue")
-        plt.xlabel("Lap")
-        plt.ylabel("Lap Time (s)")
-        plt.title("Lap Times")
-        plt.show()
+    def plot_lap_times(laps, lap_times, show=True, filename=None):
+        fig, ax = new_figure(show, figsize=None)
+        ax.plot(laps, lap_times, color="blue")
+        ax.set_xlabel("Lap")
+        ax.set_ylabel("Lap Time (s)")
+        ax.set_title("Lap Times")
+        return finish(fig, show, filename)
 
     @staticmethod
-    def plot_fuel(laps, fuel_use):
-        plt.plot(laps, fuel_use, color="green")
-        plt.xlabel("Lap")
-        plt.ylabel("Fuel Used (L)")
-        plt.title("Fuel Consumption")
-        plt.show()
+    def plot_fuel(laps, fuel_use, show=True, filename=None):
+        fig, ax = new_figure(show, figsize=None)
+        ax.plot(laps, fuel_use, color="green")
+        ax.set_xlabel("Lap")
+        ax.set_ylabel("Fuel Used (L)")
+        ax.set_title("Fuel Consumption")
+        return finish(fig, show, filename)
 
     @staticmethod
-    def plot_tire_wear(laps, tire_wear):
-        plt.plot(laps, tire_wear, color="red")
-        plt.xlabel("Lap")
-        plt.ylabel("Tire Wear")
-        plt.title("Tire Wear Progression")
-        plt.show()
+    def plot_tire_wear(laps, tire_wear, show=True, filename=None):
+        fig, ax = new_figure(show, figsize=None)
+        ax.plot(laps, tire_wear, color="red")
+        ax.set_xlabel("Lap")
+        ax.set_ylabel("Tire Wear")
+        ax.set_title("Tire Wear Progression")
+        return finish(fig, show, filename)
 
 
 # Plotting
@@ -48,3 +54,6 @@ if __name__ == "__main__":
     TelemetryPlots.plot_lap_times(laps, lap_times)
     TelemetryPlots.plot_fuel(laps, fuel_use)
     TelemetryPlots.plot_tire_wear(laps, tire_wear)
+
+    fig = TelemetryPlots.plot_lap_times(laps, lap_times, show=False)
+    print(f"Headless figure → {type(fig).__name__}, {len(fig.axes[0].lines)} line(s)")
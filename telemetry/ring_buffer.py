@@ -0,0 +1,130 @@
+#ring_buffer.py
+
+"""
+
+Preallocated multichannel ring buffer for live telemetry.
+Holds the most recent `capacity` samples of every channel in one 2-D array,
+hands out zero-copy views of the latest window and keeps a monotonic sample
+counter so readers can tell when they have fallen behind.
+
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed-size (channels, capacity) ring. Sample k (counting every sample ever
+    written from 0) lives in column k % capacity.
+
+    Converts to an array of the buffered samples in time order (`__array__`),
+    so it can be passed directly to TelemetryTools.smooth / differentiate /
+    stats and to anything else that calls np.asarray.
+    """
+
+    def __init__(self, channels: int, capacity: int, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.data = np.zeros((channels, capacity), dtype=dtype)
+        self.written = 0   # total samples ever written (monotonic)
+
+    @property
+    def channels(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def capacity(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def oldest(self) -> int:
+        """Sample counter of the oldest sample still buffered."""
+        return max(self.written - self.capacity, 0)
+
+    def __len__(self):
+        return min(self.written, self.capacity)
+
+    def extend(self, chunk):
+        """
+        Append a (channels, n) chunk; only its last `capacity` samples can
+        survive. A 1-D chunk is accepted only by a single-channel buffer.
+        """
+        chunk = np.asarray(chunk)
+        if chunk.ndim == 1 and self.channels == 1:
+            chunk = chunk[None, :]
+        if chunk.ndim != 2 or chunk.shape[0] != self.channels:
+            raise ValueError(f"Expected a ({self.channels}, n) chunk, got shape {chunk.shape}")
+        n = chunk.shape[1]
+        tail = chunk[:, max(n - self.capacity, 0):]
+        start = (self.written + n - tail.shape[1]) % self.capacity
+
+        first = min(tail.shape[1], self.capacity - start)
+        self.data[:, start:start + first] = tail[:, :first]
+        self.data[:, :tail.shape[1] - first] = tail[:, first:]
+        self.written += n
+
+    def views(self, n: int = None) -> tuple:
+        """
+        Zero-copy views of the latest `n` samples (default: everything buffered),
+        oldest first: one (channels, n) view, or two when the window wraps.
+        """
+        n = len(self) if n is None else min(n, len(self))
+        end = self.written % self.capacity or self.capacity
+        start = end - n
+        if start >= 0:
+            return (self.data[:, start:end],)
+        return (self.data[:, start:], self.data[:, :end])
+
+    def latest(self, n: int = None) -> np.ndarray:
+        """Latest `n` samples as one array: a view when contiguous, else a copy."""
+        parts = self.views(n)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts, axis=1)
+
+    def since(self, cursor: int):
+        """
+        Samples written after sample counter `cursor`.
+
+        Returns:
+            views:   views as in `views`, oldest first
+            cursor:  counter to pass on the next call
+            missed:  samples overwritten before they could be read (overrun)
+        """
+        missed = max(self.oldest - cursor, 0)
+        return self.views(self.written - cursor - missed), self.written, missed
+
+    def __array__(self, dtype=None, copy=None):
+        parts = self.views()
+        converts = dtype is not None and np.dtype(dtype) != self.data.dtype
+        if copy is False and (len(parts) > 1 or converts):
+            raise ValueError("The buffered window wraps or needs a dtype conversion; "
+                             "it cannot be returned without a copy")
+        array = parts[0] if len(parts) == 1 else np.concatenate(parts, axis=1)
+        if copy and len(parts) == 1 and not converts:
+            array = array.copy()
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+
+# Example usage
+
+if __name__ == "__main__":
+    from telemetry.generator import TelemetryGenerator, CHANNELS
+
+    gen = TelemetryGenerator(laps=3, max_speed=140, fuel_capacity=20)
+    ring = RingBuffer(len(CHANNELS), capacity=3000)   # last 30 s at 100 Hz
+
+    cursor = 0
+    received = 0
+    missed = 0
+    for i, chunk in enumerate(gen.stream(sample_rate=100.0, chunk_size=500, seed=2)):
+        ring.extend(chunk)
+        if i % 8 == 0:  # a slow reader that only catches up every few chunks
+            parts, cursor, lost = ring.since(cursor)
+            received += sum(part.shape[1] for part in parts)
+            missed += lost
+
+    speed = np.asarray(ring)[CHANNELS.index("speed")]
+    print("Ring Buffer Example:")
+    print(f"Written {ring.written} samples, buffered {len(ring)} ({ring.data.nbytes / 1e3:.0f} kB)")
+    print(f"Reader received {received}, missed {missed} to overruns")
+    print(f"Latest window pieces: {[p.shape for p in ring.views()]}")
+    print(f"Mean speed over the last 30 s: {speed.mean():.1f} km/h")
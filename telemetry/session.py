@@ -0,0 +1,123 @@
+#session.py
+
+"""
+
+Memory-mapped reader for sessions written by TelemetryExport.to_binary.
+Channels are exposed as lazily created, read-only NumPy views into the
+mapped file, so only the pages that are actually read are loaded.
+
+"""
+
+from dataclasses import dataclass
+import mmap
+
+import numpy as np
+
+from telemetry.export import TelemetryExport
+
+
+class TelemetrySession:
+
+    def __init__(self, filename, time_channel="time", lap_channel="lap"):
+        self.filename = filename
+        self.header = TelemetryExport.read_binary_header(filename)
+        self.time_channel = time_channel
+        self.lap_channel = lap_channel
+        self._entries = {entry["name"]: entry for entry in self.header["channels"]}
+        self._views = {}
+        self._file = open(filename, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def channels(self):
+        return list(self._entries)
+
+    @property
+    def samples(self) -> int:
+        return self.header["samples"]
+
+    @property
+    def sample_rate(self):
+        return self.header["sample_rate"]
+
+    def unit(self, name) -> str:
+        return self._entries[name]["unit"]
+
+    def __len__(self):
+        return self.samples
+
+    def __getitem__(self, name) -> np.ndarray:
+        """Zero-copy view of a whole channel; created on first access."""
+        if name not in self._views:
+            entry = self._entries[name]
+            dtype = np.dtype(entry["dtype"])
+            self._views[name] = np.frombuffer(self._map, dtype=dtype,
+                                              count=entry["nbytes"] // dtype.itemsize,
+                                              offset=entry["offset"])
+        return self._views[name]
+
+    def lap(self, n) -> "SessionSlice":
+        """Samples of lap `n`; the lap channel must be non-decreasing."""
+        laps = self[self.lap_channel]
+        start, stop = np.searchsorted(laps, [n, n + 1], side="left")
+        return SessionSlice(self, int(start), int(stop))
+
+    def between(self, t0, t1) -> "SessionSlice":
+        """Samples with t0 <= time < t1; the time channel must be increasing."""
+        times = self[self.time_channel]
+        start, stop = np.searchsorted(times, [t0, t1], side="left")
+        return SessionSlice(self, int(start), int(stop))
+
+    def close(self):
+        """Release the mapping; it stays alive while views handed out are still referenced."""
+        self._views.clear()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass
+class SessionSlice:
+    session: TelemetrySession
+    start: int
+    stop: int
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, name) -> np.ndarray:
+        """Zero-copy view of one channel restricted to this slice."""
+        return self.session[name][self.start:self.stop]
+
+    def to_dict(self) -> dict:
+        """Copy every channel of the slice into memory."""
+        return {name: np.array(self[name]) for name in self.session.channels}
+
+
+# Example usage
+
+if __name__ == "__main__":
+    from telemetry.generator import TelemetryGenerator, CHANNELS
+
+    gen = TelemetryGenerator(laps=20, max_speed=140, fuel_capacity=20)
+    chunks = np.concatenate(list(gen.stream(sample_rate=100.0, seed=1)), axis=1)
+    TelemetryExport.to_binary("session.bin", dict(zip(CHANNELS, chunks)),
+                              units={"time": "s", "speed": "km/h", "fuel": "L"},
+                              sample_rate=100.0)
+
+    with TelemetrySession("session.bin") as session:
+        print("Telemetry Session Example:")
+        print(f"Channels → {session.channels} ({session.samples} samples)")
+        lap5 = session.lap(5)
+        print(f"Lap 5 → {len(lap5)} samples, mean speed {lap5['speed'].mean():.1f} "
+              f"{session.unit('speed')}")
+        window = session.between(600.0, 660.0)
+        print(f"600–660 s → max speed {window['speed'].max():.1f} km/h")
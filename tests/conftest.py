@@ -0,0 +1,10 @@
+# conftest.py
+
+"""
+Shared test setup: render figures headless so no test opens a window.
+
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
@@ -0,0 +1,56 @@
+# test_aero_map.py
+
+import os
+
+import numpy as np
+import pytest
+
+from analysis.aero_map import AeroMapGrid
+
+DEMO_MAP = os.path.join(os.path.dirname(__file__), "..", "data", "setups", "aero_map_demo.json")
+
+
+def _linear_grid(edge="clamp"):
+    # cd and cl linear in both axes, so multilinear interpolation is exact
+    x = np.arange(5) * 0.5
+    y = np.arange(4) * 2.0
+    X, Y = np.meshgrid(x, y, indexing="ij")
+    return AeroMapGrid(("x", "y"), np.array([0.0, 0.0]), np.array([0.5, 2.0]),
+                       1.0 + 0.1 * X + 0.01 * Y, 3.0 - 0.2 * X + 0.05 * Y, area=1.2, edge=edge)
+
+
+def test_interpolation_is_exact_for_linear_tables():
+    grid = _linear_grid()
+    rng = np.random.default_rng(0)
+    x, y = rng.uniform(0, 2, 1000), rng.uniform(0, 6, 1000)
+    cd, cl = grid.coefficients(x, y)
+    np.testing.assert_allclose(cd, 1.0 + 0.1 * x + 0.01 * y, rtol=1e-12)
+    np.testing.assert_allclose(cl, 3.0 - 0.2 * x + 0.05 * y, rtol=1e-12)
+
+
+def test_grid_nodes_are_reproduced():
+    grid = AeroMapGrid.from_json(DEMO_MAP)
+    axes = [grid.start[k] + grid.step[k] * np.arange(n) for k, n in enumerate(grid.cd.shape)]
+    mesh = np.meshgrid(*axes, indexing="ij")
+    cd, cl = grid.coefficients(*mesh)
+    np.testing.assert_allclose(cd, grid.cd, rtol=1e-12)
+    np.testing.assert_allclose(cl, grid.cl, rtol=1e-12)
+
+
+def test_edge_modes():
+    clamp, extrapolate = _linear_grid("clamp"), _linear_grid("extrapolate")
+    assert clamp.coefficients(5.0, 0.0)[0] == pytest.approx(1.0 + 0.1 * 2.0)
+    assert extrapolate.coefficients(5.0, 0.0)[0] == pytest.approx(1.0 + 0.1 * 5.0)
+
+
+def test_non_finite_coordinates_give_nan():
+    grid = _linear_grid("extrapolate")
+    cd, cl = grid.coefficients([0.5, np.nan, 1.0, np.inf], [1.0, 1.0, np.nan, 1.0])
+    assert np.isfinite(cd[0]) and np.isfinite(cl[0])
+    assert np.isnan(cd[1:]).all() and np.isnan(cl[1:]).all()
+
+
+def test_grids_compare_and_hash_by_identity():
+    grid, other = _linear_grid(), _linear_grid()
+    assert grid == grid and grid != other
+    assert len({grid, other, grid}) == 2
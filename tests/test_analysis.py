@@ -0,0 +1,53 @@
+# test_analysis.py
+
+import numpy as np
+import pytest
+
+from telemetry.analysis import TelemetryAnalysis
+
+
+@pytest.fixture
+def stints():
+    rng = np.random.default_rng(4)
+    return [rng.normal(75 + 0.3 * i, 1.5, n) + 0.05 * np.arange(n)
+            for i, n in enumerate([1, 2, 5, 12, 23, 8])]
+
+
+def test_statistics_match_per_stint_reference(stints):
+    values, offsets = TelemetryAnalysis.pack_stints(stints)
+    table = TelemetryAnalysis.compare_many(values, offsets, trim=0.1, bootstrap=200, seed=0)
+    table = table[np.argsort(table["stint"])]
+
+    for row, laps in zip(table, stints):
+        n = laps.size
+        cut = int(np.floor(0.1 * n))
+        assert row["laps"] == n
+        assert row["mean"] == pytest.approx(np.mean(laps))
+        assert row["median"] == pytest.approx(np.median(laps))
+        assert row["trimmed_mean"] == pytest.approx(np.mean(np.sort(laps)[cut:n - cut]))
+        if n > 1:
+            assert row["slope"] == pytest.approx(np.polyfit(np.arange(n), laps, 1)[0])
+            assert row["ci_low"] <= row["mean"] <= row["ci_high"]
+        else:
+            assert np.isnan(row["slope"])
+
+
+def test_rows_are_ranked_fastest_first(stints):
+    values, offsets = TelemetryAnalysis.pack_stints(stints)
+    labels = [f"S{i}" for i in range(len(stints))]
+    table = TelemetryAnalysis.compare_many(values, offsets, labels=labels, bootstrap=0, rank_by="median")
+    assert np.all(np.diff(table["median"]) >= 0)
+    np.testing.assert_array_equal(table["rank"], np.arange(1, len(stints) + 1))
+    assert [table["label"][i] for i in range(len(stints))] == [labels[s] for s in table["stint"]]
+    assert np.all(np.isnan(table["ci_low"]))
+
+
+def test_empty_stints_are_rejected(stints):
+    values, offsets = TelemetryAnalysis.pack_stints(stints[:2] + [np.empty(0)] + stints[2:])
+    with pytest.raises(ValueError, match=r"at \[2\]"):
+        TelemetryAnalysis.compare_many(values, offsets)
+
+
+def test_no_stints():
+    values, offsets = TelemetryAnalysis.pack_stints([])
+    assert TelemetryAnalysis.compare_many(values, offsets).size == 0
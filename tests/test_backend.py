@@ -0,0 +1,59 @@
+# test_backend.py
+
+import numpy as np
+import pytest
+
+from analysis import lap_simulator
+from utils import backend
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    previous = backend._backend
+    yield
+    backend._backend = previous
+
+
+def test_invalid_environment_value_falls_back_to_auto(monkeypatch):
+    monkeypatch.setenv("FSAE_BACKEND", "bogus")
+    with pytest.warns(RuntimeWarning, match="FSAE_BACKEND"):
+        backend._backend_from_environment()
+    assert backend.get_backend() in backend.available_backends()
+    with backend.use_backend("numpy"):
+        assert backend.get_backend() == "numpy"
+    assert backend.get_backend() in backend.available_backends()
+
+
+def test_environment_value_is_applied(monkeypatch):
+    monkeypatch.setenv("FSAE_BACKEND", "numpy")
+    backend._backend_from_environment()
+    assert backend.get_backend() == "numpy"
+
+
+@pytest.mark.skipif(backend.numba is None, reason="numba is not installed")
+def test_time_stepped_backends_agree():
+    lengths = np.array([120.0, 40.0, 300.0, 25.0, 80.0])
+    is_corner = np.array([False, True, False, True, False])
+    limits = np.array([np.inf, 14.0, np.inf, 11.0, np.inf])
+    args = (lengths, is_corner, limits, 0.05, 230.0, 80_000.0, 0.9, 1.2, 1.225)
+    with backend.use_backend("numpy"):
+        vectorized = lap_simulator._time_stepped(*args)
+    with backend.use_backend("numba"):
+        compiled = lap_simulator._time_stepped(*args)
+    np.testing.assert_array_equal(vectorized, compiled)
+
+
+@pytest.mark.skipif(backend.numba is None, reason="numba is not installed")
+@pytest.mark.parametrize("setups", [1, 4, 20])    # per-setup float recurrence and array steps
+def test_euler_backends_agree(setups):
+    from simulation.simulator import SimpleSimulator
+
+    sim = SimpleSimulator(duration=5.0, dt=0.01)
+    mass = np.linspace(200.0, 260.0, setups)
+    v0 = np.linspace(0.0, 20.0, setups)
+    with backend.use_backend("numpy"):
+        _, v_numpy, x_numpy = sim.run_batch(mass=mass, v0=v0)
+    with backend.use_backend("numba"):
+        _, v_numba, x_numba = sim.run_batch(mass=mass, v0=v0)
+    np.testing.assert_array_equal(v_numpy, v_numba)
+    np.testing.assert_array_equal(x_numpy, x_numba)
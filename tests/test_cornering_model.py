@@ -0,0 +1,47 @@
+# test_cornering_model.py
+
+import numpy as np
+import pytest
+
+from analysis.cornering_model import CorneringModel
+
+
+def test_mechanical_grip_and_straights():
+    model = CorneringModel(mass=230.0, mu=1.8)
+    with np.errstate(all="raise"):
+        speeds, unbounded = model.cornering_speeds([10.0, np.inf])
+    assert speeds[0] == pytest.approx(np.sqrt(1.8 * 9.81 * 10.0))
+    assert np.isinf(speeds[1])
+    assert unbounded.tolist() == [False, True]
+
+
+def test_closed_form_matches_fixed_point():
+    model = CorneringModel(mass=230.0, mu=1.8, downforce_coeff=12.0)
+    v = model.cornering_speed(10.0)
+    assert v == pytest.approx(np.sqrt(1.8 * model.normal_force(v) * 10.0 / 230.0))
+    assert v == pytest.approx(53.86, abs=0.01)
+
+
+def test_unbounded_beyond_critical_radius():
+    model = CorneringModel(mass=230.0, mu=1.8, downforce_coeff=12.0)
+    speeds, unbounded = model.cornering_speeds([10.6, 11.0, np.inf])
+    assert speeds[0] == pytest.approx(203.46, abs=0.01)
+    assert unbounded.tolist() == [False, True, True]
+    assert np.isinf(speeds[1:]).all()
+
+
+def test_callable_model_agrees_with_closed_form():
+    radii = np.array([5.0, 10.0, 10.6, 11.0, np.inf])
+    quadratic = CorneringModel(mass=230.0, mu=1.8, downforce_coeff=12.0)
+    callable_ = CorneringModel(mass=230.0, mu=1.8, downforce_model=lambda v: 12.0 * v**2)
+    expected, expected_unbounded = quadratic.cornering_speeds(radii)
+    speeds, unbounded = callable_.cornering_speeds(radii)
+    np.testing.assert_array_equal(unbounded, expected_unbounded)
+    np.testing.assert_allclose(speeds, expected, rtol=1e-7)
+
+
+def test_scalar_and_array_shapes():
+    model = CorneringModel(mass=230.0, mu=1.8, downforce_coeff=1.0)
+    assert isinstance(model.cornering_speed(20.0), float)
+    speeds, unbounded = model.cornering_speeds(np.full((2, 3), 20.0))
+    assert speeds.shape == unbounded.shape == (2, 3)
@@ -0,0 +1,27 @@
+# test_doe.py
+
+import numpy as np
+
+from analysis.doe import SweepRunner, grid_design
+
+
+def _echo(params):
+    return {"kind": float(isinstance(params["speed_samples"], int) and isinstance(params["solver"], str)),
+            "mass_out": params["mass"]}
+
+
+def test_grid_design_keeps_level_dtypes():
+    design = grid_design(mass=[220.0, 240.0], speed_samples=[10, 20], solver=["distance", "time"])
+    assert design.size == 8
+    assert design.dtype["mass"].kind == "f"
+    assert design.dtype["speed_samples"].kind == "i"
+    assert design.dtype["solver"].kind == "U"
+
+
+def test_run_passes_parameters_unconverted():
+    design = grid_design(mass=[220.0, 240.0], speed_samples=[10, 20], solver=["distance", "time"])
+    results, report = SweepRunner(_echo, workers=1).run(design)
+    assert np.all(results["kind"] == 1.0)
+    np.testing.assert_array_equal(results["mass_out"], design["mass"])
+    np.testing.assert_array_equal(results["solver"], design["solver"])
+    assert report["cases"] == 8
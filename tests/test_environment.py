@@ -0,0 +1,25 @@
+# test_environment.py
+
+import numpy as np
+import pytest
+
+from simulation.environment import Environment
+
+
+def test_array_inputs_are_copied_and_read_only():
+    temps = np.array([10.0, 20.0])
+    env = Environment(temps)
+    before = env.air_density().copy()
+    temps[0] = 40.0
+    np.testing.assert_array_equal(env.air_density(), before)
+    with pytest.raises(ValueError):
+        env.temperature[0] = 40.0
+    with pytest.raises(ValueError):
+        env.air_density()[0] = 1.0
+
+
+def test_reassignment_recomputes_density():
+    env = Environment([10.0, 20.0])
+    env.air_density()
+    env.temperature = [40.0, 20.0]
+    np.testing.assert_allclose(env.air_density(), 1.225 * 273.15 / (np.array([40.0, 20.0]) + 273.15))
@@ -0,0 +1,115 @@
+# test_export.py
+
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from telemetry.export import BINARY_ALIGN, CSVStreamWriter, JSONLinesStreamWriter, TelemetryExport
+
+
+def test_json_lines_are_valid_json(tmp_path):
+    filename = tmp_path / "stream.jsonl"
+    with JSONLinesStreamWriter(filename, ["time", "lap", "speed", "pit", "driver"]) as writer:
+        writer.write({
+            "time": np.array([0.0, 0.1, 0.2]),
+            "lap": np.array([1, 1, 2]),
+            "speed": np.array([31.5, np.nan, np.inf]),
+            "pit": np.array([False, True, False]),
+            "driver": np.array(["A", "B", 'C"']),
+        })
+    rows = [json.loads(line) for line in filename.read_text().splitlines()]
+    assert rows == [
+        {"time": 0.0, "lap": 1, "speed": 31.5, "pit": False, "driver": "A"},
+        {"time": 0.1, "lap": 1, "speed": None, "pit": True, "driver": "B"},
+        {"time": 0.2, "lap": 2, "speed": None, "pit": False, "driver": 'C"'},
+    ]
+
+
+def test_floats_round_trip_exactly(tmp_path):
+    filename = tmp_path / "stream.jsonl"
+    values = np.random.default_rng(0).normal(size=100)
+    with JSONLinesStreamWriter(filename, ["x"]) as writer:
+        writer.write(values[None, :])
+    parsed = [json.loads(line)["x"] for line in filename.read_text().splitlines()]
+    np.testing.assert_array_equal(parsed, values)
+
+
+def test_json_lines_column_names_with_braces(tmp_path):
+    filename = tmp_path / "stream.jsonl"
+    with JSONLinesStreamWriter(filename, ["speed{kmh}", "{}"]) as writer:
+        writer.write(np.array([[1.5, 2.5], [3.0, 4.0]]))
+    rows = [json.loads(line) for line in filename.read_text().splitlines()]
+    assert rows == [{"speed{kmh}": 1.5, "{}": 3.0}, {"speed{kmh}": 2.5, "{}": 4.0}]
+
+
+def test_csv_stream_quotes_fields(tmp_path):
+    filename = tmp_path / "stream.csv"
+    with CSVStreamWriter(filename, ["lap", "driver, name", "speed"]) as writer:
+        writer.write({"lap": np.array([1, 2]),
+                      "driver, name": np.array(["Smith, J", 'Doe "JD"']),
+                      "speed": np.array([31.25, np.nan])})
+    with open(filename, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [["lap", "driver, name", "speed"],
+                    ["1", "Smith, J", "31.25"],
+                    ["2", 'Doe "JD"', "nan"]]
+
+
+def _binary_channels(n):
+    rng = np.random.default_rng(1)
+    return {
+        "time": np.arange(n) * 0.01,
+        "lap": np.repeat(np.arange(1, 5, dtype=np.uint16), -(-n // 4))[:n],
+        "speed": rng.normal(30, 5, n).astype(np.float32),
+        "gear": rng.integers(1, 7, n).astype(np.int8),
+        "pit": rng.random(n) < 0.1,
+        "odometer": np.arange(n, dtype=">i8"),            # big-endian input
+        "rpm": rng.normal(9000, 500, n).astype(">f4"),
+    }
+
+
+def test_binary_round_trip_mixed_dtypes(tmp_path):
+    filename = tmp_path / "session.bin"
+    channels = _binary_channels(1001)
+    stats = TelemetryExport.to_binary(filename, channels, units={"speed": "m/s"}, sample_rate=100.0)
+    assert stats["bytes"] == filename.stat().st_size
+
+    header = TelemetryExport.read_binary_header(filename)
+    assert header["samples"] == 1001 and header["sample_rate"] == 100.0
+    assert [c["name"] for c in header["channels"]] == list(channels)
+    assert all(c["offset"] % BINARY_ALIGN == 0 for c in header["channels"])
+
+    loaded = TelemetryExport.from_binary(filename)
+    for name, values in channels.items():
+        assert loaded[name].dtype == values.dtype.newbyteorder("<")
+        assert loaded[name].dtype.byteorder in "<|="
+        np.testing.assert_array_equal(loaded[name], values)
+
+
+def test_binary_round_trip_empty_channels(tmp_path):
+    filename = tmp_path / "empty.bin"
+    TelemetryExport.to_binary(filename, _binary_channels(0))
+    loaded = TelemetryExport.from_binary(filename)
+    assert TelemetryExport.read_binary_header(filename)["samples"] == 0
+    assert all(values.size == 0 for values in loaded.values())
+    assert loaded["speed"].dtype == np.float32
+
+
+def test_binary_header_grows_to_fit_many_channels(tmp_path):
+    filename = tmp_path / "wide.bin"
+    channels = {f"channel_with_a_long_descriptive_name_{i:03d}": np.full(3, i, dtype=np.int32)
+                for i in range(200)}
+    TelemetryExport.to_binary(filename, channels)
+    header = TelemetryExport.read_binary_header(filename)
+    first = header["channels"][0]["offset"]
+    assert first >= len(json.dumps(header)) and first % BINARY_ALIGN == 0
+    loaded = TelemetryExport.from_binary(filename)
+    for name, values in channels.items():
+        np.testing.assert_array_equal(loaded[name], values)
+
+
+def test_binary_rejects_ragged_channels(tmp_path):
+    with pytest.raises(ValueError, match="same length"):
+        TelemetryExport.to_binary(tmp_path / "bad.bin", {"a": np.zeros(3), "b": np.zeros(4)})
@@ -0,0 +1,55 @@
+# test_filters.py
+
+import numpy as np
+import pytest
+
+from analysis.telemetry_tools import ExponentialFilter, MovingAverageFilter, TelemetryTools
+
+
+def _reference_smooth(x, window):
+    before, after = window // 2, (window - 1) // 2
+    return np.array([x[max(i - before, 0):i + after + 1].mean() for i in range(x.size)])
+
+
+def _reference_exponential(x, alpha):
+    y = np.empty_like(x)
+    prev = x[0]
+    for i, value in enumerate(x):
+        prev = prev + alpha * (value - prev)
+        y[i] = prev
+    return y
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 8, 101])
+def test_smooth_matches_reference(window):
+    x = np.random.default_rng(1).normal(20, 3, 400)
+    np.testing.assert_allclose(TelemetryTools(window).smooth(x), _reference_smooth(x, window),
+                               rtol=1e-12, atol=1e-12)
+
+
+def test_moving_average_stream_is_bit_identical():
+    x = np.random.default_rng(2).normal(size=(2, 1000))
+    whole = TelemetryTools(7).smooth(x)
+    f = MovingAverageFilter(7)
+    parts = [f.process(x[:, i:i + 37]) for i in range(0, x.shape[1], 37)] + [f.flush()]
+    np.testing.assert_array_equal(np.concatenate(parts, axis=-1), whole)
+
+
+@pytest.mark.parametrize("alpha", [1.0, 0.5, 0.01])
+def test_exponential_matches_recurrence(alpha):
+    x = np.random.default_rng(3).normal(20, 3, 3000)
+    np.testing.assert_allclose(TelemetryTools().exponential(x, alpha),
+                               _reference_exponential(x, alpha), rtol=1e-9)
+
+
+def test_exponential_stream_is_bit_identical():
+    x = np.random.default_rng(4).normal(size=5000)
+    whole = ExponentialFilter(0.05).process(x)
+    f = ExponentialFilter(0.05)
+    streamed = np.concatenate([f.process(x[i:i + 333]) for i in range(0, x.size, 333)])
+    np.testing.assert_array_equal(streamed, whole)
+
+
+def test_exponential_rejects_bad_alpha():
+    with pytest.raises(ValueError):
+        ExponentialFilter(0.0)
@@ -0,0 +1,120 @@
+# test_ingest.py
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from telemetry.generator import CHANNELS, TelemetryGenerator
+from telemetry.ingest import IngestBuffer, IngestServer, ReplaySender, encode_frames
+
+
+def _block(start, n):
+    return np.tile(np.arange(start, start + n, dtype=float), (len(CHANNELS), 1))
+
+
+def _session(seed=3):
+    generator = TelemetryGenerator(laps=1, max_speed=140, fuel_capacity=20)
+    return generator, np.concatenate(list(generator.stream(sample_rate=10.0, seed=seed)), axis=1)
+
+
+def test_drop_oldest_buffer_keeps_the_newest_samples():
+    buffer = IngestBuffer(capacity=10, policy="drop_oldest")
+    assert buffer.put_nowait(_block(0, 6)) == 0
+    assert buffer.put_nowait(_block(6, 6)) == 2
+    assert buffer.put_nowait(_block(12, 15)) == 15
+    assert len(buffer) == 10
+    np.testing.assert_array_equal(buffer.drain()[0], np.arange(17, 27))
+
+
+def test_block_buffer_waits_for_room():
+    async def scenario():
+        buffer = IngestBuffer(capacity=8, policy="block")
+        assert buffer.put_nowait(_block(0, 6)) == 0
+        assert buffer.put_nowait(_block(6, 4)) == 4     # no room and put_nowait cannot wait
+        writer = asyncio.create_task(buffer.put(_block(6, 4)))
+        await asyncio.sleep(0.01)
+        assert not writer.done()
+        first = await buffer.get()
+        assert await writer == 0
+        return first, buffer.drain()
+
+    first, rest = asyncio.run(scenario())
+    np.testing.assert_array_equal(first[0], np.arange(6))
+    np.testing.assert_array_equal(rest[0], np.arange(6, 10))
+
+
+def test_udp_drop_oldest_on_localhost():
+    async def scenario():
+        generator, _ = _session()
+        buffer = IngestBuffer(capacity=100, policy="drop_oldest")
+        async with IngestServer(buffer, protocol="udp") as server:
+            sender = ReplaySender(generator, server.host, server.port, protocol="udp",
+                                  frames_per_packet=16)
+            sent = await sender.run(sample_rate=10.0, seed=3)
+            await asyncio.sleep(0.1)
+        return sent, server.stats, buffer.drain()
+
+    sent, stats, kept = asyncio.run(scenario())
+    _, session = _session()
+    assert sent == session.shape[1] > 100
+    assert stats.frames == sent
+    assert stats.lost == 0
+    assert stats.dropped == sent - 100
+    np.testing.assert_allclose(kept, session[:, -100:], rtol=1e-6)
+
+
+def test_tcp_block_delivers_every_frame_in_order():
+    async def scenario():
+        generator, _ = _session()
+        buffer = IngestBuffer(capacity=64, policy="block")
+        received = []
+        peak = []
+
+        async def consume():
+            while True:
+                peak.append(len(buffer))
+                received.append(await buffer.get())
+                await asyncio.sleep(0.001)    # a consumer slower than the sender
+
+        async with IngestServer(buffer, protocol="tcp") as server:
+            consumer = asyncio.create_task(consume())
+            sender = ReplaySender(generator, server.host, server.port, protocol="tcp",
+                                  frames_per_packet=50)
+            sent = await sender.run(sample_rate=10.0, seed=3)
+            while sum(block.shape[1] for block in received) < sent:
+                await asyncio.sleep(0.01)
+            consumer.cancel()
+        return sent, server.stats, np.concatenate(received, axis=1), max(peak)
+
+    sent, stats, received, peak = asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+    _, session = _session()
+    assert stats.frames == sent == session.shape[1]
+    assert stats.dropped == 0 and stats.lost == 0
+    assert peak <= 64
+    np.testing.assert_allclose(received, session, rtol=1e-6)
+
+
+def test_sequence_gaps_are_counted_as_lost():
+    async def scenario():
+        buffer = IngestBuffer(capacity=1000)
+        async with IngestServer(buffer, protocol="udp") as server:
+            loop = asyncio.get_running_loop()
+            transport, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol, remote_addr=(server.host, server.port))
+            for first_seq in (0, 4, 14, 18):    # frames 8-13 never sent
+                transport.sendto(encode_frames(_block(first_seq, 4), first_seq))
+                await asyncio.sleep(0.01)
+            transport.close()
+            await asyncio.sleep(0.05)
+        return server.stats
+
+    stats = asyncio.run(scenario())
+    assert stats.frames == 16
+    assert stats.lost == 6
+
+
+@pytest.mark.parametrize("policy", ["fifo", "drop_newest"])
+def test_unknown_policy_raises(policy):
+    with pytest.raises(ValueError, match="Unknown policy"):
+        IngestBuffer(policy=policy)
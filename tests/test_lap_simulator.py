@@ -0,0 +1,88 @@
+# test_lap_simulator.py
+
+import numpy as np
+import pytest
+
+from analysis.lap_simulator import LapSimulator, SimplePhysics, SimpleTrack, TrackSegment
+
+
+@pytest.fixture
+def sim():
+    physics = SimplePhysics(mass=230.0, power=80_000.0, drag_coeff=0.9, frontal_area=1.2)
+    track = SimpleTrack([
+        TrackSegment(100, "straight"),
+        TrackSegment(40, "corner", radius=25),
+        TrackSegment(120, "straight"),
+        TrackSegment(30, "corner", radius=18),
+    ])
+    return LapSimulator(physics, track)
+
+
+def _legacy_run(sim):
+    """The original per-step loop the time solver must reproduce."""
+    speeds, total_time, v = [], 0.0, 0.0
+    for seg in sim.track.segments:
+        for _ in range(int(seg.length / (max(v, 1e-3) * sim.dt)) + 1):
+            if seg.segment_type == "straight":
+                v = max(v + sim.physics.acceleration(v) * sim.dt, 0)
+            else:
+                v = min(v, sim.corner_speed(seg.radius))
+            speeds.append(v)
+            total_time += sim.dt
+    return np.arange(len(speeds)), np.array(speeds), total_time
+
+
+def test_default_solver_is_the_legacy_time_solver(sim):
+    positions, speeds, lap_time = sim.run()
+    expected_positions, expected_speeds, expected_time = _legacy_run(sim)
+    np.testing.assert_array_equal(positions, expected_positions)
+    np.testing.assert_allclose(speeds, expected_speeds, rtol=1e-12)
+    assert lap_time == pytest.approx(expected_time)
+
+
+def test_distance_solver_respects_corner_limits(sim):
+    sim.solver = "distance"
+    positions, speeds, lap_time = sim.run()
+    assert positions[0] == 0.0
+    assert positions[-1] == pytest.approx(sum(seg.length for seg in sim.track.segments))
+    assert speeds[0] == 0.0
+
+    _, limits = sim.stations()
+    assert np.all(speeds <= limits + 1e-9)
+    assert np.all(speeds[1:] > 0.0)
+
+    # Slower than flat-out at the slowest corner speed would allow, faster than a crawl
+    mean_speed = positions[-1] / lap_time
+    assert 0.5 * sim.corner_speed(18) < mean_speed < np.max(speeds)
+
+
+def test_distance_solver_converges_with_station_spacing(sim):
+    sim.solver = "distance"
+    coarse = sim.run()[2]
+    sim.ds = 0.1
+    fine = sim.run()[2]
+    assert coarse == pytest.approx(fine, rel=1e-2)
+
+
+def test_unknown_solver_raises(sim):
+    sim.solver = "euler"
+    with pytest.raises(ValueError, match="Unknown solver"):
+        sim.run()
+
+
+def test_distance_solver_without_drag(sim):
+    sim.solver = "distance"
+    _, _, with_drag = sim.run()
+    sim.physics.drag_coeff = 0.0
+    positions, speeds, lap_time = sim.run()
+    assert np.isfinite(lap_time) and np.all(np.isfinite(speeds))
+    assert lap_time < with_drag
+    assert np.all(speeds <= sim.stations()[1] + 1e-9)
+
+
+@pytest.mark.parametrize("field, value", [("power", 0.0), ("power", -1.0), ("drag_coeff", -0.5)])
+def test_distance_solver_rejects_non_positive_power_or_drag(sim, field, value):
+    sim.solver = "distance"
+    setattr(sim.physics, field, value)
+    with pytest.raises(ValueError, match="distance solver"):
+        sim.run()
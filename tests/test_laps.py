@@ -0,0 +1,42 @@
+# test_laps.py
+
+import numpy as np
+import pytest
+
+from telemetry.laps import LapIndex, LapSegmenter
+
+
+def _circuit(rate=50.0, laps=5, lap_time=20.0, radius=30.0):
+    t = np.arange(0.0, laps * lap_time + 3.0, 1.0 / rate) + 0.013
+    angle = 2 * np.pi * (t / lap_time - 0.1)
+    return t, radius * np.cos(angle), radius * np.sin(angle)
+
+
+def test_gate_crossing_times_are_unbiased():
+    # The car crosses y = 0 (x > 0) heading +y at t = 2 + 20 n
+    t, x, y = _circuit()
+    seg = LapSegmenter(gate=((20.0, 0.0), (40.0, 0.0)), hysteresis=2.0)
+    seg.update(t, x=x, y=y)
+    np.testing.assert_allclose(seg.index.times, 2.0 + 20.0 * np.arange(6), atol=1e-4)
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 100])
+def test_gate_crossings_do_not_depend_on_chunking(chunk):
+    t, x, y = _circuit()
+    whole = LapSegmenter(gate=((20.0, 0.0), (40.0, 0.0)))
+    whole.update(t, x=x, y=y)
+    streamed = LapSegmenter(gate=((20.0, 0.0), (40.0, 0.0)))
+    for i in range(0, t.size, chunk):
+        streamed.update(t[i:i + chunk], x=x[i:i + chunk], y=y[i:i + chunk])
+    np.testing.assert_array_equal(streamed.index.offsets, whole.index.offsets)
+    np.testing.assert_allclose(streamed.index.times, whole.index.times, rtol=0, atol=1e-9)
+
+
+def test_distance_wraps_and_validity():
+    t = np.arange(0.0, 100.0, 0.1)
+    distance = (t % 30.0) * 10.0
+    seg = LapSegmenter(index=LapIndex(min_lap_time=29.0, max_lap_time=31.0))
+    seg.update(t, distance=distance)
+    assert len(seg.index) == 2
+    assert seg.index.valid.all()
+    assert seg.index.lap_time(0) == pytest.approx(30.0)
@@ -0,0 +1,44 @@
+# test_ring_buffer.py
+
+import numpy as np
+import pytest
+
+from telemetry.ring_buffer import RingBuffer
+
+
+def test_extend_wraps_and_keeps_latest_samples():
+    ring = RingBuffer(2, 5)
+    ring.extend(np.arange(8.0).reshape(2, 4))
+    ring.extend(np.arange(8.0, 14.0).reshape(2, 3))
+    np.testing.assert_array_equal(np.asarray(ring), [[2, 3, 8, 9, 10], [6, 7, 11, 12, 13]])
+    assert ring.written == 7 and ring.oldest == 2
+
+
+def test_extend_rejects_chunks_with_the_wrong_channel_count():
+    ring = RingBuffer(3, 5)
+    with pytest.raises(ValueError, match=r"\(3, n\)"):
+        ring.extend([1.0, 2.0])
+    with pytest.raises(ValueError, match=r"\(3, n\)"):
+        ring.extend(np.zeros((2, 4)))
+    assert ring.written == 0
+
+
+def test_single_channel_buffer_accepts_1d_chunks():
+    ring = RingBuffer(1, 4)
+    ring.extend([1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(np.asarray(ring), [[1.0, 2.0, 3.0]])
+
+
+def test_array_protocol_copy_semantics():
+    ring = RingBuffer(1, 4)
+    ring.extend([1.0, 2.0, 3.0])
+    view = np.asarray(ring, copy=False)
+    assert np.shares_memory(view, ring.data)
+    assert not np.shares_memory(np.array(ring, copy=True), ring.data)
+
+    ring.extend([4.0, 5.0])    # the window now wraps
+    with pytest.raises(ValueError):
+        np.asarray(ring, copy=False)
+    with pytest.raises(ValueError):
+        np.asarray(RingBuffer(1, 4), dtype=np.float32, copy=False)
+    np.testing.assert_array_equal(np.asarray(ring), [[2.0, 3.0, 4.0, 5.0]])
@@ -0,0 +1,39 @@
+# test_running_stats.py
+
+import numpy as np
+import pytest
+
+from analysis.telemetry_tools import RunningStats
+
+
+def test_moments_match_numpy():
+    x = 1e6 + np.random.default_rng(0).normal(0, 2, 200_000)
+    stats = RunningStats(seed=0).update(x)
+    assert stats.count == x.size
+    assert stats.mean == pytest.approx(x.mean(), rel=1e-12)
+    assert stats.variance == pytest.approx(x.var(), rel=1e-9)
+    assert (stats.min, stats.max) == (x.min(), x.max())
+
+
+def test_merge_equals_single_pass():
+    x = np.random.default_rng(1).exponential(3.0, 50_000)
+    whole = RunningStats(seed=0).update(x)
+    parts = [RunningStats(seed=i).update(chunk) for i, chunk in enumerate(np.array_split(x, 7))]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    assert merged.count == whole.count
+    assert merged.mean == pytest.approx(whole.mean, rel=1e-12)
+    assert merged.variance == pytest.approx(whole.variance, rel=1e-10)
+
+
+def test_sketch_quantiles_are_close():
+    x = np.random.default_rng(2).uniform(0, 1, 100_000)
+    stats = RunningStats(sketch_size=4096, seed=0)
+    for chunk in np.array_split(x, 20):
+        stats.update(chunk)
+    np.testing.assert_allclose(stats.quantile([0.1, 0.5, 0.9]), [0.1, 0.5, 0.9], atol=0.03)
+
+
+def test_empty_variance_is_nan():
+    assert np.isnan(RunningStats().variance)
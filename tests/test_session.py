@@ -0,0 +1,50 @@
+# test_session.py
+
+import numpy as np
+import pytest
+
+from telemetry.export import TelemetryExport
+from telemetry.session import TelemetrySession
+
+
+@pytest.fixture
+def session_file(tmp_path):
+    time = np.arange(1000) * 0.1                      # 100 s at 10 Hz
+    lap = np.repeat(np.arange(1, 5), [230, 260, 250, 260]).astype(np.uint16)
+    speed = (20 + np.sin(time)).astype(np.float32)
+    filename = tmp_path / "session.bin"
+    TelemetryExport.to_binary(filename, {"time": time, "lap": lap, "speed": speed},
+                              units={"time": "s", "speed": "m/s"}, sample_rate=10.0)
+    return filename, time, lap, speed
+
+
+def test_session_exposes_channels_as_read_only_views(session_file):
+    filename, time, lap, speed = session_file
+    with TelemetrySession(filename) as session:
+        assert session.channels == ["time", "lap", "speed"]
+        assert len(session) == 1000 and session.sample_rate == 10.0
+        assert session.unit("speed") == "m/s" and session.unit("lap") == ""
+        np.testing.assert_array_equal(session["speed"], speed)
+        assert session["speed"] is session["speed"]
+        assert not session["time"].flags.writeable
+
+
+def test_lap_slices(session_file):
+    filename, time, lap, speed = session_file
+    with TelemetrySession(filename) as session:
+        for n in range(1, 5):
+            piece = session.lap(n)
+            np.testing.assert_array_equal(piece["speed"], speed[lap == n])
+            np.testing.assert_array_equal(piece["time"], time[lap == n])
+        assert len(session.lap(9)) == 0
+        assert session.lap(2).to_dict()["lap"].tolist() == [2] * 260
+
+
+def test_between_is_half_open(session_file):
+    filename, time, lap, speed = session_file
+    with TelemetrySession(filename) as session:
+        window = session.between(10.0, 20.0)
+        mask = (time >= 10.0) & (time < 20.0)
+        assert len(window) == mask.sum()
+        np.testing.assert_array_equal(window["speed"], speed[mask])
+        assert len(session.between(200.0, 300.0)) == 0
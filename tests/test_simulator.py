@@ -0,0 +1,60 @@
+# test_simulator.py
+
+import time
+
+import numpy as np
+import pytest
+
+from simulation.simulator import SimpleSimulator
+from utils import backend
+
+
+def _baseline_run(sim):
+    """The original per-step SimpleSimulator.run loop."""
+    steps = int(sim.duration / sim.dt) + 1
+    v = np.zeros(steps)
+    x = np.zeros(steps)
+    for i in range(1, steps):
+        drag = 0.5 * sim.rho * sim.drag_coeff * sim.frontal_area * v[i - 1]**2
+        a = (sim.power / max(v[i - 1], 1e-3) - drag) / sim.mass
+        v[i] = max(v[i - 1] + a * sim.dt, 0.0)
+        x[i] = x[i - 1] + v[i] * sim.dt
+    return v, x
+
+
+def _best_of(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_numpy_run_matches_baseline_loop():
+    sim = SimpleSimulator(duration=10.0, dt=0.01)
+    with backend.use_backend("numpy"):
+        _, v, x = sim.run()
+    v_ref, x_ref = _baseline_run(sim)
+    np.testing.assert_allclose(v, v_ref, rtol=1e-12)
+    np.testing.assert_allclose(x, x_ref, rtol=1e-12)
+
+
+def test_numpy_run_is_not_slower_than_baseline_loop():
+    sim = SimpleSimulator(duration=10.0, dt=0.001)
+    with backend.use_backend("numpy"):
+        current = _best_of(sim.run)
+    baseline = _best_of(lambda: _baseline_run(sim))
+    assert current < 1.5 * baseline
+
+
+@pytest.mark.parametrize("setups", [3, 20])
+def test_numpy_ensemble_matches_single_runs(setups):
+    sim = SimpleSimulator(duration=5.0, dt=0.01)
+    powers = np.linspace(60_000.0, 90_000.0, setups)
+    with backend.use_backend("numpy"):
+        _, v, x = sim.run_batch(power=powers, v0=5.0)
+        for n in (0, setups - 1):
+            _, v_one, x_one = SimpleSimulator(power=powers[n], duration=5.0, dt=0.01).run_batch(v0=5.0)
+            np.testing.assert_array_equal(v[n], v_one[0])
+            np.testing.assert_array_equal(x[n], x_one[0])
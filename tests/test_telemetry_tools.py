@@ -0,0 +1,42 @@
+# test_telemetry_tools.py
+
+import numpy as np
+import pytest
+
+from analysis.telemetry_tools import TelemetryTools
+
+
+def test_differentiate_matches_central_differences():
+    signal = np.random.default_rng(0).normal(size=(3, 50))
+    deriv = TelemetryTools().differentiate(signal, 0.1)
+    np.testing.assert_allclose(deriv[:, 1:-1], (signal[:, 2:] - signal[:, :-2]) / 0.2)
+    np.testing.assert_array_equal(deriv[:, 0], deriv[:, 1])
+    np.testing.assert_array_equal(deriv[:, -1], deriv[:, -2])
+
+
+@pytest.mark.parametrize("shape", [(2,), (3, 2)])
+def test_differentiate_two_samples_is_one_sided(shape):
+    signal = np.arange(np.prod(shape), dtype=float).reshape(shape) ** 2
+    out = np.full(shape, np.nan)
+    deriv = TelemetryTools().differentiate(signal, 0.5, out=out)
+    expected = (signal[..., 1:] - signal[..., :1]) / 0.5
+    np.testing.assert_array_equal(deriv, np.broadcast_to(expected, shape))
+
+
+@pytest.mark.parametrize("shape", [(1,), (0,), (4, 1)])
+def test_differentiate_single_sample_is_zero(shape):
+    deriv = TelemetryTools().differentiate(np.ones(shape), 0.1, out=np.full(shape, np.nan))
+    np.testing.assert_array_equal(deriv, np.zeros(shape))
+
+
+@pytest.mark.parametrize("window", [1, 3])
+def test_smooth_accepts_a_ring_buffer(window):
+    from telemetry.ring_buffer import RingBuffer
+
+    ring = RingBuffer(2, 4)
+    ring.extend(np.arange(12.0).reshape(2, 6))
+    smoothed = TelemetryTools(smoothing_window=window).smooth(ring)
+    assert isinstance(smoothed, np.ndarray)
+    assert smoothed.shape == (2, 4)
+    if window == 1:
+        np.testing.assert_array_equal(smoothed, [[2, 3, 4, 5], [8, 9, 10, 11]])
@@ -0,0 +1,70 @@
+# test_track.py
+
+import numpy as np
+import pytest
+
+from simulation.track import Track, TrackSegment
+
+
+def _oval(radius=25.0, straight=100.0):
+    return Track([
+        TrackSegment(straight, "straight"),
+        TrackSegment(np.pi * radius, "corner", radius=radius, direction=1),
+        TrackSegment(straight, "straight"),
+        TrackSegment(np.pi * radius, "corner", radius=radius, direction=1),
+    ])
+
+
+@pytest.mark.parametrize("ds", [0.3, 1.0, 7.0])
+def test_full_oval_closes(ds):
+    compiled = _oval().compile(ds)
+    assert compiled.length == pytest.approx(200.0 + 2 * np.pi * 25.0)
+    assert compiled.heading[-1] == pytest.approx(2 * np.pi)
+    assert abs(compiled.x[-1]) < 1e-9 and abs(compiled.y[-1]) < 1e-9
+    assert np.max(compiled.y) == pytest.approx(50.0)
+
+
+def test_segment_boundaries_land_on_stations():
+    track = Track([
+        TrackSegment(33.3, "straight"),
+        TrackSegment(17.1, "corner", radius=12.0, direction=-1),
+        TrackSegment(0.2, "straight"),
+        TrackSegment(41.0, "corner", radius=30.0, direction=1),
+    ])
+    compiled = track.compile(ds=2.0)
+    boundaries = np.cumsum([seg.length for seg in track.segments])
+    nearest = np.abs(compiled.distance[:, None] - boundaries[None, :]).min(axis=0)
+    assert np.all(nearest < 1e-9)
+    assert np.all(np.diff(compiled.distance) <= 2.0 + 1e-12)
+    # Curvature changes only at those boundaries
+    changes = compiled.distance[1:-1][np.diff(compiled.curvature[:-1]) != 0]
+    assert np.all(np.abs(changes[:, None] - boundaries[None, :]).min(axis=1) < 1e-9)
+
+
+def test_compile_is_cached_per_spacing():
+    track = _oval()
+    coarse = track.compile(1.0)
+    assert track.compile(1.0) is coarse
+    fine = track.compile(0.5)
+    assert fine is not coarse and len(fine) > len(coarse)
+    assert track.compile(1.0) is coarse
+    assert not coarse.x.flags.writeable
+
+
+def test_cache_is_dropped_after_mutating_a_segment():
+    track = _oval()
+    before = track.compile(1.0)
+    track.segments[0].length = 150.0
+    after = track.compile(1.0)
+    assert after is not before
+    assert after.length == pytest.approx(before.length + 50.0)
+
+    track.segments.append(TrackSegment(10.0, "straight"))
+    assert track.compile(1.0).length == pytest.approx(after.length + 10.0)
+
+
+def test_compiled_track_compares_by_identity():
+    compiled = _oval().compile(1.0)
+    other = _oval().compile(1.0)
+    assert compiled == compiled and compiled != other
+    assert len({compiled, other, compiled}) == 2
@@ -0,0 +1,51 @@
+# test_track_index.py
+
+import numpy as np
+import pytest
+
+from simulation.track import Track, TrackSegment
+from simulation.track_index import TrackIndex
+
+
+@pytest.fixture(scope="module")
+def index():
+    track = Track([
+        TrackSegment(200, "straight"),
+        TrackSegment(np.pi * 40, "corner", radius=40, direction=1),
+        TrackSegment(200, "straight"),
+        TrackSegment(np.pi * 40, "corner", radius=40, direction=1),
+    ])
+    return TrackIndex.build(track.compile(ds=0.5))
+
+
+def test_near_points_recover_station_and_offset(index):
+    track = index.track
+    rng = np.random.default_rng(0)
+    s = rng.uniform(0, track.length, 2000)
+    off = rng.uniform(-2, 2, s.size)
+    heading = np.interp(s, track.distance, track.heading)
+    x = np.interp(s, track.distance, track.x) - off * np.sin(heading)
+    y = np.interp(s, track.distance, track.y) + off * np.cos(heading)
+    distance, offset = index.locate(x, y)
+    error = (distance - s + track.length / 2) % track.length - track.length / 2
+    assert np.median(np.abs(error)) < 0.05
+    assert np.median(np.abs(offset - off)) < 0.05
+
+
+def test_far_points_match_brute_force(index):
+    track = index.track
+    rng = np.random.default_rng(1)
+    x = rng.uniform(-400, 600, 3000)
+    y = rng.uniform(-400, 500, 3000)
+    _, offset = index.locate(x, y)
+    nearest = np.sqrt(((track.x[None, :] - x[:, None])**2 + (track.y[None, :] - y[:, None])**2).min(axis=1))
+    # The projection onto the centerline can only be closer than the nearest station
+    assert np.all(np.abs(offset) <= nearest + 1e-9)
+    assert np.all(np.abs(offset) >= nearest - 0.5 * track.ds)
+
+
+def test_index_compares_and_hashes_by_identity():
+    compiled = Track([TrackSegment(100.0, "straight")]).compile(1.0)
+    first, other = TrackIndex.build(compiled), TrackIndex.build(compiled)
+    assert first == first and first != other
+    assert len({first, other}) == 2
@@ -0,0 +1,100 @@
+#backend.py
+
+"""
+
+Kernel backend selection for the simulation inner loops.
+Each kernel has a loop implementation, compiled with numba when it is
+installed, and a NumPy implementation used otherwise.
+
+"""
+
+from contextlib import contextmanager
+import os
+import warnings
+
+try:
+    import numba
+except ImportError:  # numba is optional
+    numba = None
+
+
+BACKENDS = ("auto", "numba", "numpy")
+
+_backend = "auto"
+
+
+def available_backends():
+    """Return the backends that can actually run in this environment."""
+    return ("numba", "numpy") if numba is not None else ("numpy",)
+
+
+def set_backend(name: str):
+    """Select "numba", "numpy" or "auto" (numba when installed, else numpy)."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}', expected one of {BACKENDS}")
+    if name == "numba" and numba is None:
+        raise ValueError("The numba backend was requested but numba is not installed")
+    _backend = name
+
+
+def get_backend() -> str:
+    """Return the backend kernels will use right now ("numba" or "numpy")."""
+    if _backend == "auto":
+        return "numba" if numba is not None else "numpy"
+    return _backend
+
+
+def _backend_from_environment():
+    """Apply FSAE_BACKEND through set_backend, falling back to "auto" if it is invalid."""
+    name = os.environ.get("FSAE_BACKEND")
+    if name:
+        try:
+            set_backend(name)
+        except ValueError as exc:
+            warnings.warn(f"Ignoring FSAE_BACKEND: {exc}; using 'auto'", RuntimeWarning, stacklevel=2)
+
+
+_backend_from_environment()
+
+
+@contextmanager
+def use_backend(name: str):
+    """Temporarily switch backend inside a `with` block."""
+    previous = _backend
+    set_backend(name)
+    try:
+        yield
+    finally:
+        set_backend(previous)
+
+
+class Kernel:
+    """
+    A numerical kernel with interchangeable implementations.
+
+    loop:   plain-Python loop written in the numba-compatible subset;
+            compiled lazily on first use with the numba backend.
+    numpy:  vectorized NumPy implementation with the same signature.
+    """
+
+    def __init__(self, loop, numpy):
+        self.loop = loop
+        self.numpy = numpy
+        self._compiled = None
+        self.__name__ = loop.__name__
+        self.__doc__ = loop.__doc__
+
+    def __call__(self, *args):
+        if get_backend() == "numba":
+            if self._compiled is None:
+                self._compiled = numba.njit(cache=True)(self.loop)
+            return self._compiled(*args)
+        return self.numpy(*args)
+
+
+def kernel(numpy):
+    """Decorator form: @kernel(numpy_impl) applied to the loop implementation."""
+    def wrap(loop):
+        return Kernel(loop, numpy)
+    return wrap
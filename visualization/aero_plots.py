@@ -6,12 +6,16 @@ Provides:
 - Drag vs speed plotting
 - Downforce vs speed plotting
 - Combined aerodynamic map visualization
+- Automatic min/max or LTTB decimation to the figure's pixel width
+- Headless rendering: every method returns its Figure (show=False skips pyplot)
 
 """
 
 from dataclasses import dataclass
 import numpy as np
-import matplotlib.pyplot as plt
+
+from visualization.decimate import plot_decimated
+from visualization.render import new_figure, finish
 
 
 @dataclass
@@ -20,43 +24,42 @@ class AeroPlotter:
     xlabel: str = "Velocity (m/s)"
     ylabel_drag: str = "Drag Force (N)"
     ylabel_downforce: str = "Downforce (N)"
+    decimation: str = "minmax"  # "minmax", "lttb" or None
+    show: bool = True           # False builds the figure headless and only returns it
 
     def plot_drag(self, velocities: np.ndarray, drag: np.ndarray):
         """Plot drag force vs speed."""
-        plt.figure(figsize=(10, 4))
-        plt.plot(velocities, drag, label="Drag", color="red")
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel_drag)
-        plt.title(f"{self.title} — Drag vs Speed")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        fig, ax = new_figure(self.show, figsize=(10, 4))
+        plot_decimated(velocities, drag, self.decimation, ax=ax, label="Drag", color="red")
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel_drag)
+        ax.set_title(f"{self.title} — Drag vs Speed")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
     def plot_downforce(self, velocities: np.ndarray, downforce: np.ndarray):
         """Plot downforce vs speed."""
-        plt.figure(figsize=(10, 4))
-        plt.plot(velocities, downforce, label="Downforce", color="blue")
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel_downforce)
-        plt.title(f"{self.title} — Downforce vs Speed")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        fig, ax = new_figure(self.show, figsize=(10, 4))
+        plot_decimated(velocities, downforce, self.decimation, ax=ax, label="Downforce", color="blue")
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel_downforce)
+        ax.set_title(f"{self.title} — Downforce vs Speed")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
     def plot_aero_map(self, velocities: np.ndarray, drag: np.ndarray, downforce: np.ndarray):
         """Plot drag and downforce together."""
-        plt.figure(figsize=(10, 5))
-        plt.plot(velocities, drag, label="Drag", color="red")
-        plt.plot(velocities, downforce, label="Downforce", color="blue")
-        plt.xlabel(self.xlabel)
-        plt.ylabel("Force (N)")
-        plt.title(f"{self.title} — Aero Map")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        fig, ax = new_figure(self.show, figsize=(10, 5))
+        plot_decimated(velocities, drag, self.decimation, ax=ax, label="Drag", color="red")
+        plot_decimated(velocities, downforce, self.decimation, ax=ax, label="Downforce", color="blue")
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel("Force (N)")
+        ax.set_title(f"{self.title} — Aero Map")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
 
 # Example usage
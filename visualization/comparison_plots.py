@@ -6,12 +6,16 @@ Provides:
 - Lap speed comparison
 - Aerodynamic force comparison
 - Telemetry signal comparison
+- Automatic min/max or LTTB decimation to the figure's pixel width
+- Headless rendering: every method returns its Figure (show=False skips pyplot)
 
 """
 
 from dataclasses import dataclass
 import numpy as np
-import matplotlib.pyplot as plt
+
+from visualization.decimate import plot_decimated
+from visualization.render import new_figure, finish
 
 
 @dataclass
@@ -19,57 +23,56 @@ class ComparisonPlotter:
     title: str = "Comparison Visualization"
     xlabel: str = "X"
     ylabel: str = "Y"
+    decimation: str = "minmax"  # "minmax", "lttb" or None
+    show: bool = True           # False builds the figure headless and only returns it
 
     def compare_laps(self, positions: np.ndarray, lap_data: dict):
         """
         Compare multiple lap speed profiles.
         lap_data: dict {label: speed_array}
         """
-        plt.figure(figsize=(10, 4))
+        fig, ax = new_figure(self.show, figsize=(10, 4))
         for label, speeds in lap_data.items():
-            plt.plot(positions, speeds * 3.6, label=label)
+            plot_decimated(positions, speeds * 3.6, self.decimation, ax=ax, label=label)
 
-        plt.xlabel(self.xlabel)
-        plt.ylabel("Speed (km/h)")
-        plt.title(f"{self.title} — Lap Comparison")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel("Speed (km/h)")
+        ax.set_title(f"{self.title} — Lap Comparison")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
     def compare_aero(self, velocities: np.ndarray, aero_data: dict):
         """
         Compare aerodynamic forces.
         aero_data: dict {label: force_array}
         """
-        plt.figure(figsize=(10, 4))
+        fig, ax = new_figure(self.show, figsize=(10, 4))
         for label, forces in aero_data.items():
-            plt.plot(velocities, forces, label=label)
+            plot_decimated(velocities, forces, self.decimation, ax=ax, label=label)
 
-        plt.xlabel(self.xlabel)
-        plt.ylabel("Force (N)")
-        plt.title(f"{self.title} — Aerodynamic Comparison")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel("Force (N)")
+        ax.set_title(f"{self.title} — Aerodynamic Comparison")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
     def compare_telemetry(self, t: np.ndarray, signals: dict):
         """
         Compare multiple telemetry signals.
         signals: dict {label: signal_array}
         """
-        plt.figure(figsize=(10, 4))
+        fig, ax = new_figure(self.show, figsize=(10, 4))
         for label, sig in signals.items():
-            plt.plot(t, sig, label=label)
-
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel)
-        plt.title(f"{self.title} — Telemetry Comparison")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+            plot_decimated(t, sig, self.decimation, ax=ax, label=label)
+
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel)
+        ax.set_title(f"{self.title} — Telemetry Comparison")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
 
 # Example usage
@@ -0,0 +1,129 @@
+# decimate.py
+
+"""
+Downsampling of long traces before they are handed to matplotlib.
+Provides:
+- Min/max envelope decimation (keeps every peak, vectorized)
+- Largest-Triangle-Three-Buckets (LTTB) decimation
+- Plot helper that decimates to the pixel width of the target axes
+
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+MODES = ("minmax", "lttb")
+
+
+def minmax(x: np.ndarray, y: np.ndarray, buckets: int):
+    """
+    Keep the minimum and maximum of each of `buckets` equal-count buckets, in
+    time order. At most 2 * buckets points are returned, so no peak is lost
+    when each bucket maps to one pixel column. NaNs are ignored unless a
+    bucket holds nothing else.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = y.size
+    if n <= 2 * buckets:
+        return x, y
+
+    size = -(-n // buckets)
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+
+    low = np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+    high = np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+    base = np.arange(buckets) * size
+    index = (base[:, None] + np.sort(np.column_stack((low, high)), axis=1)).ravel()
+    index = np.minimum(index, n - 1)
+    return x[index], y[index]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int):
+    """
+    Largest-Triangle-Three-Buckets: keep the first and last samples and, from
+    each of threshold - 2 buckets in between, the sample forming the largest
+    triangle with the previously kept sample and the next bucket's mean.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = y.size
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    # Bucket i covers [edges[i], edges[i + 1]); bucket means are computed up front
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.int64) + 1
+    counts = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(x[:n - 1].astype(float), edges[:-1]) / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:n - 1].astype(float), edges[:-1]) / counts, y[-1])
+
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - mean_x[i + 1]) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (mean_y[i + 1] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
+def decimate(x, y, width: int, mode: str = "minmax"):
+    """
+    Reduce (x, y) to about `width` pixel columns: one min/max pair per column
+    for "minmax", 2 * width points for "lttb"; mode None returns the input.
+    """
+    if mode is None:
+        return x, y
+    if mode == "minmax":
+        return minmax(x, y, width)
+    if mode == "lttb":
+        return lttb(x, y, 2 * width)
+    raise ValueError(f"Unknown decimation mode '{mode}', expected one of {MODES} or None")
+
+
+def plot_decimated(x, y, mode: str = "minmax", ax=None, **kwargs):
+    """Drop-in for plt.plot that first decimates to the pixel width of the axes."""
+    ax = ax or plt.gca()
+    width = max(int(np.ceil(ax.bbox.width)), 1)
+    x, y = decimate(x, y, width, mode)
+    return ax.plot(x, y, **kwargs)
+
+
+# Example usage
+
+if __name__ == "__main__":
+    import time
+
+    # One hour of 1 kHz data with a few short spikes
+    t = np.arange(3_600_000) / 1000.0
+    rng = np.random.default_rng(0)
+    signal = 20 + 5 * np.sin(2 * np.pi * t / 75) + rng.normal(0, 0.5, t.size)
+    signal[rng.integers(0, t.size, 5)] += 15
+
+    for mode in (None, "minmax", "lttb"):
+        plt.figure(figsize=(10, 4))
+        start = time.perf_counter()
+        line, = plot_decimated(t, signal, mode)
+        decimated = time.perf_counter() - start
+        plt.gcf().canvas.draw()
+        total = time.perf_counter() - start
+        print(f"{str(mode):>6}: {len(line.get_xdata()):>9} points, "
+              f"peak {np.max(line.get_ydata()):.1f}, decimate+plot {decimated:.3f} s, "
+              f"with render {total:.3f} s")
+        plt.close()
+
+    plt.figure(figsize=(10, 4))
+    plot_decimated(t, signal, "minmax", label="Min/Max Envelope")
+    plt.xlabel("Time (s)")
+    plt.ylabel("Signal")
+    plt.title("Decimated 1 kHz Trace (1 h)")
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
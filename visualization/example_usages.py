@@ -11,11 +11,11 @@ Integration demo for visualization modules:
 
 import numpy as np
 
-from style import apply_style, PlotStyleConfig
-from lap_plots import LapPlotter
-from aero_plots import AeroPlotter
-from telemetry_plots import TelemetryPlotter
-from comparison_plots import ComparisonPlotter
+from visualization.style import apply_style, PlotStyleConfig
+from visualization.lap_plots import LapPlotter
+from visualization.aero_plots import AeroPlotter
+from visualization.telemetry_plots import TelemetryPlotter
+from visualization.comparison_plots import ComparisonPlotter
 
 
 # ---------------------------------------------------------
@@ -6,12 +6,16 @@ Provides:
 - Speed profile plotting
 - Acceleration profile plotting
 - Optional integration with global style settings
+- Automatic min/max or LTTB decimation to the figure's pixel width
+- Headless rendering: every method returns its Figure (show=False skips pyplot)
 
 """
 
 from dataclasses import dataclass
 import numpy as np
-import matplotlib.pyplot as plt
+
+from visualization.decimate import plot_decimated
+from visualization.render import new_figure, finish
 
 
 @dataclass
@@ -20,18 +24,19 @@ class LapPlotter:
     xlabel: str = "Track Position (units)"
     ylabel_speed: str = "Speed (km/h)"
     ylabel_accel: str = "Acceleration (m/s²)"
+    decimation: str = "minmax"  # "minmax", "lttb" or None
+    show: bool = True           # False builds the figure headless and only returns it
 
     def plot_speed_profile(self, positions: np.ndarray, speeds: np.ndarray):
         """Plot speed profile along the lap."""
-        plt.figure(figsize=(10, 4))
-        plt.plot(positions, speeds * 3.6, label="Speed")
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel_speed)
-        plt.title(f"{self.title} — Speed Profile")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        fig, ax = new_figure(self.show, figsize=(10, 4))
+        plot_decimated(positions, speeds * 3.6, self.decimation, ax=ax, label="Speed")
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel_speed)
+        ax.set_title(f"{self.title} — Speed Profile")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
     def plot_acceleration_profile(self, positions: np.ndarray, speeds: np.ndarray, dt: float):
         """Plot acceleration computed from speed data."""
@@ -40,15 +45,14 @@ class LapPlotter:
         accel[0] = accel[1]
         accel[-1] = accel[-2]
 
-        plt.figure(figsize=(10, 4))
-        plt.plot(positions, accel, label="Acceleration", color="orange")
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel_accel)
-        plt.title(f"{self.title} — Acceleration Profile")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        fig, ax = new_figure(self.show, figsize=(10, 4))
+        plot_decimated(positions, accel, self.decimation, ax=ax, label="Acceleration", color="orange")
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel_accel)
+        ax.set_title(f"{self.title} — Acceleration Profile")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
 
 # Example usage
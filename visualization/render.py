@@ -0,0 +1,137 @@
+# render.py
+
+"""
+Figure construction and batch rendering for the visualization modules.
+Provides:
+- Figure factory that stays off the global pyplot state when not showing
+- Shared finishing step (layout, optional save, optional show)
+- Process-pool batch renderer with per-figure timing
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import os
+import time
+
+from matplotlib.figure import Figure
+import matplotlib.pyplot as plt
+
+
+def new_figure(show: bool = True, figsize=(10, 4)):
+    """
+    Create a figure and its single axes.
+
+    With show=False the Figure is built directly through the object-oriented
+    API: it is never registered with pyplot, needs no GUI backend and is
+    freed as soon as it is no longer referenced.
+    """
+    fig = plt.figure(figsize=figsize) if show else Figure(figsize=figsize)
+    return fig, fig.add_subplot()
+
+
+def finish(fig, show: bool = True, filename: str = None, dpi: int = None):
+    """Apply the shared layout, optionally save and show, and return the figure."""
+    fig.tight_layout()
+    if filename:
+        fig.savefig(filename, dpi=dpi)
+    if show:
+        plt.show()
+    return fig
+
+
+@dataclass
+class FigureJob:
+    """
+    One figure to render: `build(*args, **kwargs)` must return a Figure.
+    Use a plotter created with show=False, e.g.
+        FigureJob(LapPlotter(show=False).plot_speed_profile, (positions, speeds), filename="lap.png")
+    """
+    build: object               # picklable callable returning a Figure
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    filename: str = None
+
+
+def _render_chunk(jobs, dpi):
+    """Build and save a chunk of figures inside a worker process."""
+    timings = []
+    for job in jobs:
+        start = time.perf_counter()
+        fig = job.build(*job.args, **job.kwargs)
+        built = time.perf_counter()
+        if job.filename:
+            fig.savefig(job.filename, dpi=dpi)
+        saved = time.perf_counter()
+        timings.append({
+            "filename": job.filename,
+            "pid": os.getpid(),
+            "build_s": built - start,
+            "save_s": saved - built,
+            "seconds": saved - start,
+        })
+    return timings
+
+
+@dataclass
+class BatchRenderer:
+    workers: int = None           # defaults to os.cpu_count()
+    chunk_size: int = None        # defaults to ~4 chunks per worker
+    dpi: int = 100
+
+    def render(self, jobs: list):
+        """
+        Render every job, saving those that have a filename.
+
+        Returns:
+            timings: one dict per job, in input order (build, save and total seconds).
+            report:  dict with wall time, figure count and figures per second.
+        """
+        jobs = list(jobs)
+        workers = self.workers or os.cpu_count() or 1
+        chunk = self.chunk_size or max(1, -(-len(jobs) // (workers * 4)))
+        chunks = [jobs[i:i + chunk] for i in range(0, len(jobs), chunk)]
+
+        start = time.perf_counter()
+        if workers == 1:
+            outputs = [_render_chunk(c, self.dpi) for c in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_render_chunk, c, self.dpi) for c in chunks]
+                outputs = [f.result() for f in futures]
+        wall = time.perf_counter() - start
+
+        timings = [t for chunk_timings in outputs for t in chunk_timings]
+        report = {
+            "figures": len(jobs),
+            "workers": workers,
+            "wall_time": wall,
+            "figure_seconds": sum(t["seconds"] for t in timings),
+            "figures_per_s": len(jobs) / wall if wall else float("inf"),
+        }
+        return timings, report
+
+
+# Example usage
+
+if __name__ == "__main__":
+    import tempfile
+    import numpy as np
+
+    from visualization.lap_plots import LapPlotter
+
+    # A 200-lap report: one speed profile per lap, rendered headless
+    positions = np.linspace(0, 1200, 20_000)
+    rng = np.random.default_rng(0)
+    plotter = LapPlotter(title="Report", xlabel="Distance (m)", show=False)
+
+    with tempfile.TemporaryDirectory() as folder:
+        jobs = [FigureJob(plotter.plot_speed_profile,
+                          (positions, 30 + 10 * np.sin(positions / 40 + lap) + rng.normal(0, 1, positions.size)),
+                          filename=os.path.join(folder, f"lap_{lap:03d}.png"))
+                for lap in range(200)]
+
+        timings, report = BatchRenderer().render(jobs)
+        print(f"{report['figures']} figures on {report['workers']} worker(s): "
+              f"{report['wall_time']:.2f} s wall, {report['figures_per_s']:.1f} figures/s, "
+              f"slowest figure {max(t['seconds'] for t in timings) * 1000:.0f} ms")
@@ -6,12 +6,16 @@ Provides:
 - Raw vs smoothed signal plotting
 - Acceleration plotting
 - Combined telemetry overlays
+- Automatic min/max or LTTB decimation to the figure's pixel width
+- Headless rendering: every method returns its Figure (show=False skips pyplot)
 
 """
 
 from dataclasses import dataclass
 import numpy as np
-import matplotlib.pyplot as plt
+
+from visualization.decimate import plot_decimated
+from visualization.render import new_figure, finish
 
 
 @dataclass
@@ -20,48 +24,47 @@ class TelemetryPlotter:
     xlabel: str = "Time (s)"
     ylabel_signal: str = "Signal"
     ylabel_accel: str = "Acceleration (m/s²)"
+    decimation: str = "minmax"  # "minmax", "lttb" or None
+    show: bool = True           # False builds the figure headless and only returns it
 
     def plot_raw_vs_smooth(self, t: np.ndarray, raw: np.ndarray, smooth: np.ndarray):
         """Plot raw and smoothed telemetry signals."""
-        plt.figure(figsize=(10, 4))
-        plt.plot(t, raw, alpha=0.4, label="Raw")
-        plt.plot(t, smooth, label="Smoothed", linewidth=2)
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel_signal)
-        plt.title(f"{self.title} — Raw vs Smoothed")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        fig, ax = new_figure(self.show, figsize=(10, 4))
+        plot_decimated(t, raw, self.decimation, ax=ax, alpha=0.4, label="Raw")
+        plot_decimated(t, smooth, self.decimation, ax=ax, label="Smoothed", linewidth=2)
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel_signal)
+        ax.set_title(f"{self.title} — Raw vs Smoothed")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
     def plot_acceleration(self, t: np.ndarray, accel: np.ndarray):
         """Plot acceleration signal."""
-        plt.figure(figsize=(10, 4))
-        plt.plot(t, accel, label="Acceleration", color="orange")
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel_accel)
-        plt.title(f"{self.title} — Acceleration")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        fig, ax = new_figure(self.show, figsize=(10, 4))
+        plot_decimated(t, accel, self.decimation, ax=ax, label="Acceleration", color="orange")
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel_accel)
+        ax.set_title(f"{self.title} — Acceleration")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
     def plot_overlay(self, t: np.ndarray, signals: dict):
         """
         Plot multiple telemetry signals on the same axes.
         signals: dict {label: array}
         """
-        plt.figure(figsize=(10, 4))
+        fig, ax = new_figure(self.show, figsize=(10, 4))
         for label, sig in signals.items():
-            plt.plot(t, sig, label=label)
+            plot_decimated(t, sig, self.decimation, ax=ax, label=label)
 
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel_signal)
-        plt.title(f"{self.title} — Overlay")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel_signal)
+        ax.set_title(f"{self.title} — Overlay")
+        ax.grid(True)
+        ax.legend()
+        return finish(fig, self.show)
 
 
 # Example usage